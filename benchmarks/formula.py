@@ -0,0 +1,86 @@
+import argparse
+import io
+import logging
+import random
+import timeit
+
+from biochemie_bot.utils import formula as fml
+
+ELEMENTS = ("C", "H", "N", "O", "S", "P", "Na", "Cl", "Ca", "Fe", "Mg", "K")
+COMMON = ("C6H12O6", "H2O", "NaCl", "CuSO4·5H2O", "Ca(OH)2", "C2H5OH", "CO2", "NH3", "H2SO4")
+
+
+def random_formula(rng: random.Random) -> str:
+    """Generate a random formula, possibly with a group and a hydrate.
+
+    Parameters
+    ----------
+    rng : random.Random
+        The random generator to use.
+
+    Returns
+    -------
+    str
+        The formula.
+    """
+
+    def part() -> str:
+        return "".join(
+            rng.choice(ELEMENTS) + str(rng.randint(1, 12)) for _ in range(rng.randint(1, 5))
+        )
+
+    formula = part()
+    if rng.random() < 0.3:  # noqa: PLR2004
+        formula += f"({part()}){rng.randint(2, 4)}"
+    if rng.random() < 0.2:  # noqa: PLR2004
+        formula += f"·{rng.randint(1, 10)}H2O"
+    return formula
+
+
+def main() -> None:
+    """Benchmark the formula parser behind `/formula batch` on random formulas."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--formulas", type=int, default=100_000, help="formulas per batch (default: 100k)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, best is shown")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random formulas")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log = logging.getLogger(__name__)
+
+    rng = random.Random(args.seed)  # noqa: S311
+    batches = {
+        "unique": [random_formula(rng) for _ in range(args.formulas)],
+        "80% common": [
+            rng.choice(COMMON) if rng.random() < 0.8 else random_formula(rng)  # noqa: PLR2004
+            for _ in range(args.formulas)
+        ],
+    }
+
+    for name, lines in batches.items():
+        for label, benchmark in (
+            ("parse", lambda lines=lines: [fml.parse_formula(line) for line in lines]),
+            ("write_csv", lambda lines=lines: fml.write_csv(lines, io.StringIO())),
+        ):
+            # Every run starts with an empty cache, like the first batch after a restart.
+            seconds = min(
+                timeit.repeat(
+                    benchmark,
+                    setup=fml._parse_formula.cache_clear,
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            log.info(
+                "%-9s %-10s %9.0f ms %9.0f formulas/s",
+                label,
+                name,
+                seconds * 1000,
+                len(lines) / seconds,
+            )
+
+
+if __name__ == "__main__":
+    main()
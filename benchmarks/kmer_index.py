@@ -0,0 +1,127 @@
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from biochemie_bot.utils.kmer_index import IndexKind, KmerIndex, build_index
+
+BASES = np.frombuffer(b"ACGT", dtype=np.uint8)
+
+
+def write_fasta(path: Path, database: npt.NDArray[np.uint8], record_length: int) -> None:
+    """Write a database as FASTA, split into records of equal length.
+
+    Parameters
+    ----------
+    path : Path
+        The file to write.
+    database : npt.NDArray[np.uint8]
+        All residues of the database.
+    record_length : int
+        Length of a record.
+    """
+    with path.open("wb") as fasta:
+        for number, start in enumerate(range(0, database.size, record_length)):
+            fasta.write(f">record {number}\n".encode())
+            fasta.write(database[start : start + record_length].tobytes() + b"\n")
+
+
+def random_queries(  # noqa: PLR0913, PLR0917
+    rng: np.random.Generator,
+    database: npt.NDArray[np.uint8],
+    record_length: int,
+    count: int,
+    length: int,
+    mismatches: int,
+) -> list[str]:
+    """Take queries from within the records of a database, with random substitutions.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        The random generator to use.
+    database : npt.NDArray[np.uint8]
+        All residues of the database.
+    record_length : int
+        Length of a record.
+    count : int
+        Amount of queries.
+    length : int
+        Length of a query.
+    mismatches : int
+        Amount of substituted positions per query.
+
+    Returns
+    -------
+    list[str]
+        The queries.
+    """
+    queries: list[str] = []
+    for _ in range(count):
+        record = rng.integers(database.size // record_length)
+        start = record * record_length + rng.integers(record_length - length)
+        query = database[start : start + length].copy()
+        positions = rng.choice(length, mismatches, replace=False)
+        query[positions] = BASES[(np.searchsorted(BASES, query[positions]) + 1) % BASES.size]
+        queries.append(query.tobytes().decode())
+
+    return queries
+
+
+def main() -> None:
+    """Benchmark building and querying a k-mer index over a random DNA database."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--residues", type=int, default=10_000_000, help="size of the database (default: 10 M)"
+    )
+    parser.add_argument("--record-length", type=int, default=10_000, help="length of a record")
+    parser.add_argument("-k", type=int, default=12, help="k-mer length (default: 12)")
+    parser.add_argument("--queries", type=int, default=200, help="queries per mismatch count")
+    parser.add_argument("--query-length", type=int, default=40, help="length of a query")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random database")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log = logging.getLogger(__name__)
+
+    rng = np.random.default_rng(args.seed)
+    database = rng.choice(BASES, args.residues)
+
+    with tempfile.TemporaryDirectory() as directory:
+        write_fasta(Path(directory) / "database.fasta", database, args.record_length)
+
+        stats = build_index(
+            Path(directory) / "database.fasta", Path(directory) / "index", args.k, IndexKind.DNA
+        )
+        log.info(
+            "Build: %d residues in %.2f s (%.1f M residues/s)",
+            stats.residues,
+            stats.seconds,
+            stats.residues / stats.seconds / 1e6,
+        )
+
+        index = KmerIndex.open(Path(directory) / "index")
+        for mismatches in range(3):
+            latencies: list[float] = []
+            for query in random_queries(
+                rng, database, args.record_length, args.queries, args.query_length, mismatches
+            ):
+                start = time.perf_counter()
+                index.search(query, mismatches)
+                latencies.append(time.perf_counter() - start)
+
+            log.info(
+                "Search with %d mismatches: median %.3f ms, max %.3f ms",
+                mismatches,
+                statistics.median(latencies) * 1000,
+                max(latencies) * 1000,
+            )
+
+
+if __name__ == "__main__":
+    main()
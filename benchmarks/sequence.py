@@ -0,0 +1,50 @@
+import argparse
+import logging
+import timeit
+
+import numpy as np
+
+from biochemie_bot.utils import sequence as seq
+
+
+def main() -> None:
+    """Benchmark the sequence engine behind the `/sequence` commands on random sequences."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--dna", type=int, default=10_000_000, help="length of the DNA sequence (default: 10 M)"
+    )
+    parser.add_argument(
+        "--protein", type=int, default=1_000_000, help="length of the protein (default: 1 M)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark, best is shown")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random sequences")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    log = logging.getLogger(__name__)
+
+    rng = np.random.default_rng(args.seed)
+    dna = rng.choice(np.frombuffer(b"ACGT", dtype=np.uint8), args.dna)
+    protein = rng.choice(np.frombuffer(b"ACDEFGHIKLMNPQRSTVWY", dtype=np.uint8), args.protein)
+    fasta = b">dna\n" + b"\n".join(
+        dna[index : index + 60].tobytes() for index in range(0, dna.size, 60)
+    )
+
+    benchmarks = {
+        f"parse_fasta ({args.dna:,} nt)": lambda: seq.parse_fasta(fasta),
+        f"detect_kind ({args.dna:,} nt)": lambda: seq.detect_kind(dna),
+        f"nucleotide_properties ({args.dna:,} nt)": lambda: seq.nucleotide_properties(
+            dna, seq.SequenceKind.DNA
+        ),
+        f"reverse_complement ({args.dna:,} nt)": lambda: seq.reverse_complement(dna),
+        f"translate ({args.dna:,} nt)": lambda: seq.translate(dna),
+        f"protein_properties ({args.protein:,} aa)": lambda: seq.protein_properties(protein),
+    }
+
+    for name, benchmark in benchmarks.items():
+        seconds = min(timeit.repeat(benchmark, number=1, repeat=args.repeat))
+        log.info("%-45s %9.1f ms", name, seconds * 1000)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,30 @@
+import asyncio
 import logging
+import time
+import weakref
+from collections.abc import Awaitable, Callable
 from datetime import datetime
-from typing import override
+from typing import NamedTuple, override
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
+from biochemie_bot.utils import autocomplete
+from biochemie_bot.utils.errors import BotDraining
+
+type FlushCallback = Callable[[], Awaitable[None]]
+
+
+class DrainReport(NamedTuple):
+    """Summary of a :meth:`BiochemieBot.drain` run."""
+
+    duration: float
+    completed_tasks: int
+    cancelled_tasks: int
+    finalized_views: int
+    flushed_buffers: int
+
 
 class BiochemieBot(commands.Bot):
     """Represents the Discord bot, which subclasses :class:`commands.Bot`."""
@@ -21,11 +40,20 @@ def __init__(
         super().__init__(command_prefix=command_prefix, intents=intents)
 
         self.initial_extensions: list[str] = initial_extensions
+        self.draining: bool = False
+        self.live_views: weakref.WeakSet[discord.ui.View] = weakref.WeakSet()
+        self._in_flight: set[asyncio.Task[object]] = set()
+        self._flush_callbacks: list[FlushCallback] = []
 
     @override
     async def setup_hook(self) -> None:
         self.app_info = await self.application_info()
         self.tree.on_error = self.on_app_command_error
+        self.tree.interaction_check = self.app_command_check
+
+        # Build the autocomplete index up front, so the first suggestion is not delayed.
+        terms = autocomplete.default_index()
+        self.log.info("Loaded autocomplete index with %d terms", len(terms.terms))
 
         for extension in self.initial_extensions:
             try:
@@ -40,6 +68,157 @@ async def on_ready(self) -> None:
 
         self.log.info("Ready: %s (%s)", self.user, self.user.id)
 
+    @override
+    async def invoke(self, ctx: commands.Context["BiochemieBot"]) -> None:
+        if self.draining:
+            # Only answer actual commands, not every message that happens to start with the prefix.
+            if ctx.valid:
+                await ctx.message.reply("The bot is shutting down, please try again later.")
+            return
+
+        self.track_current_task()
+        await super().invoke(ctx)
+
+    async def app_command_check(self, interaction: discord.Interaction) -> bool:
+        """Global app command check, refuses new interactions while draining.
+
+        Parameters
+        ----------
+        interaction : discord.Interaction
+            The interaction to check.
+
+        Returns
+        -------
+        bool
+            Whether the interaction should be processed.
+
+        Raises
+        ------
+        BotDraining
+            The bot is draining and no longer accepts new interactions.
+        """
+        if self.draining:
+            if interaction.type is discord.InteractionType.autocomplete:
+                return False
+
+            raise BotDraining
+
+        self.track_current_task()
+        return True
+
+    def register_view(self, view: discord.ui.View) -> None:
+        """Keep track of a view, so a drain can finalize it while it is still live.
+
+        Parameters
+        ----------
+        view : discord.ui.View
+            The view to track, only held by a weak reference.
+        """
+        self.live_views.add(view)
+
+    def track_current_task(self) -> None:
+        """Mark the currently running task as in-flight work which a drain should wait for."""
+        task = asyncio.current_task()
+        if task is None or task in self._in_flight:
+            return
+
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    def register_flush(self, callback: FlushCallback) -> None:
+        """Register a coroutine function to be awaited when the bot drains.
+
+        Parameters
+        ----------
+        callback : FlushCallback
+            Coroutine function without arguments, used to flush buffered state.
+        """
+        self._flush_callbacks.append(callback)
+
+    def unregister_flush(self, callback: FlushCallback) -> None:
+        """Remove a callback previously added with :meth:`register_flush`.
+
+        Parameters
+        ----------
+        callback : FlushCallback
+            The callback to remove.
+        """
+        try:
+            self._flush_callbacks.remove(callback)
+        except ValueError:
+            pass
+
+    async def drain(
+        self, deadline: float = 30, view_batch_size: int = 5, view_batch_delay: float = 1
+    ) -> DrainReport:
+        """Stop accepting new work and finish everything in progress.
+
+        In-flight commands and interactions are awaited until ``deadline``, after which they are
+        cancelled. Live views are then finalized in batches, to stay clear of rate limits, and
+        all registered flush callbacks are awaited. The gateway is not closed.
+
+        Parameters
+        ----------
+        deadline : float
+            Seconds to wait for in-flight tasks before cancelling them.
+        view_batch_size : int
+            Amount of views to finalize at once.
+        view_batch_delay : float
+            Seconds to wait between view batches.
+
+        Returns
+        -------
+        DrainReport
+            Summary of the drain, including how long it took.
+        """
+        start = time.perf_counter()
+        self.draining = True
+
+        current = asyncio.current_task()
+        pending = {task for task in self._in_flight if task is not current}
+        cancelled_tasks = 0
+        if pending:
+            _done, still_pending = await asyncio.wait(pending, timeout=deadline)
+            for task in still_pending:
+                task.cancel()
+            cancelled_tasks = len(still_pending)
+
+        views = [view for view in self.live_views if not view.is_finished()]
+        for index in range(0, len(views), view_batch_size):
+            if index:
+                await asyncio.sleep(view_batch_delay)
+
+            batch = views[index : index + view_batch_size]
+            for view in batch:
+                view.stop()
+
+            results = await asyncio.gather(
+                *(view.on_timeout() for view in batch), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    self.log.warning("Failed to finalize view during drain.", exc_info=result)
+
+        flushed_buffers = 0
+        for callback in self._flush_callbacks:
+            try:
+                await callback()
+            except Exception:
+                self.log.exception("Failed to flush buffer during drain: %r", callback)
+            else:
+                flushed_buffers += 1
+
+        report = DrainReport(
+            duration=time.perf_counter() - start,
+            completed_tasks=len(pending) - cancelled_tasks,
+            cancelled_tasks=cancelled_tasks,
+            finalized_views=len(views),
+            flushed_buffers=flushed_buffers,
+        )
+        self.log.info("Drained in %.2fs: %s", report.duration, report)
+
+        return report
+
     @override
     async def on_command_error(
         self, ctx: commands.Context["BiochemieBot"], error: commands.CommandError
@@ -70,6 +249,8 @@ async def on_command_error(
                 pass
         elif isinstance(error, commands.MissingRequiredArgument):
             await ctx.message.reply(f"Command `{ctx.command}` failed to process, {error}")
+        elif isinstance(error, commands.BadArgument):
+            await ctx.message.reply(str(error))
         else:
             await ctx.message.reply(f"Something went wrong while processing `{ctx.command}`.")
 
@@ -87,7 +268,11 @@ async def on_app_command_error(
         error : app_commands.AppCommandError
             The actual error.
         """
-        if isinstance(error, app_commands.CommandNotFound):
+        if isinstance(error, BotDraining):
+            await interaction.response.send_message(
+                "The bot is shutting down, please try again later.", ephemeral=True
+            )
+        elif isinstance(error, app_commands.CommandNotFound):
             await interaction.response.send_message(
                 "This command is temporarily disabled.", ephemeral=True
             )
@@ -0,0 +1,345 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import override
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from biochemie_bot.bot import BiochemieBot
+from biochemie_bot.utils import alignment as aln
+from biochemie_bot.utils import sequence as seq
+from biochemie_bot.utils.attachments import read_attachment
+from biochemie_bot.utils.views.paginator import PaginatorView
+
+MAX_ATTACHMENT_SIZE = 2**20
+MAX_DP_CELLS = 500_000_000
+MAX_WORKERS = 4
+BLOCK_WIDTH = 60
+BLOCKS_PER_PAGE = 8
+
+
+class Alignment(commands.Cog):
+    """Includes pairwise sequence alignment commands."""
+
+    def __init__(self, bot: BiochemieBot) -> None:
+        self.bot: BiochemieBot = bot
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.executor: ProcessPoolExecutor | None = None
+
+    @override
+    async def cog_load(self) -> None:
+        self.executor = ProcessPoolExecutor(
+            max_workers=min(MAX_WORKERS, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    @override
+    async def cog_unload(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+    align_group: app_commands.Group = app_commands.Group(
+        name="align", description="Pairwise sequence alignment commands."
+    )
+
+    @align_group.command(name="global")
+    @app_commands.describe(
+        sequence_a="The first sequence",
+        sequence_b="The second sequence",
+        file="A FASTA file, the first two records are aligned",
+        matrix="The substitution matrix, NUC for nucleotides and BLOSUM62 for proteins by default",
+        gap_open="Penalty of the first position of a gap",
+        gap_extend="Penalty of every following position of a gap",
+        band="Only consider paths this close to the diagonal, fast for long similar sequences",
+        score_only="Only calculate the score, uses much less memory",
+    )
+    @app_commands.checks.cooldown(1, 10)
+    async def global_(  # noqa: PLR0913, PLR0917
+        self,
+        interaction: discord.Interaction,
+        sequence_a: str | None = None,
+        sequence_b: str | None = None,
+        file: discord.Attachment | None = None,
+        matrix: aln.ScoringMatrix | None = None,
+        gap_open: app_commands.Range[int, 0, 100] = 10,
+        gap_extend: app_commands.Range[int, 0, 100] = 1,
+        band: app_commands.Range[int, 1] | None = None,
+        score_only: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        """Globally align two sequences using Needleman-Wunsch."""
+        await self._align(
+            interaction,
+            aln.AlignmentMode.GLOBAL,
+            sequence_a,
+            sequence_b,
+            file,
+            matrix,
+            gap_open,
+            gap_extend,
+            band,
+            score_only,
+        )
+
+    @align_group.command(name="local")
+    @app_commands.describe(
+        sequence_a="The first sequence",
+        sequence_b="The second sequence",
+        file="A FASTA file, the first two records are aligned",
+        matrix="The substitution matrix, NUC for nucleotides and BLOSUM62 for proteins by default",
+        gap_open="Penalty of the first position of a gap",
+        gap_extend="Penalty of every following position of a gap",
+        band="Only consider paths this close to the diagonal, fast for long similar sequences",
+        score_only="Only calculate the score, uses much less memory",
+    )
+    @app_commands.checks.cooldown(1, 10)
+    async def local(  # noqa: PLR0913, PLR0917
+        self,
+        interaction: discord.Interaction,
+        sequence_a: str | None = None,
+        sequence_b: str | None = None,
+        file: discord.Attachment | None = None,
+        matrix: aln.ScoringMatrix | None = None,
+        gap_open: app_commands.Range[int, 0, 100] = 10,
+        gap_extend: app_commands.Range[int, 0, 100] = 1,
+        band: app_commands.Range[int, 1] | None = None,
+        score_only: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        """Locally align two sequences using Smith-Waterman."""
+        await self._align(
+            interaction,
+            aln.AlignmentMode.LOCAL,
+            sequence_a,
+            sequence_b,
+            file,
+            matrix,
+            gap_open,
+            gap_extend,
+            band,
+            score_only,
+        )
+
+    async def _align(  # noqa: PLR0911, PLR0913, PLR0917
+        self,
+        interaction: discord.Interaction,
+        mode: aln.AlignmentMode,
+        sequence_a: str | None,
+        sequence_b: str | None,
+        file: discord.Attachment | None,
+        matrix: aln.ScoringMatrix | None,
+        gap_open: int,
+        gap_extend: int,
+        band: int | None,
+        score_only: bool,  # noqa: FBT001
+    ) -> None:
+        """Validate the input, run the alignment in the process pool and send the result."""
+        if self.executor is None:
+            await interaction.response.send_message(
+                "Alignments are currently unavailable.", ephemeral=True
+            )
+            return
+
+        if gap_open < gap_extend:
+            await interaction.response.send_message(
+                "The gap open penalty must be at least the gap extend penalty.", ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(thinking=True)
+
+        records = await _read_records(interaction, sequence_a, sequence_b, file)
+        if records is None:
+            return
+
+        first, second = records
+        try:
+            kinds = {seq.detect_kind(first.sequence), seq.detect_kind(second.sequence)}
+        except ValueError as error:
+            await interaction.followup.send(str(error))
+            return
+
+        if matrix is None:
+            matrix = (
+                aln.ScoringMatrix.BLOSUM62
+                if seq.SequenceKind.PROTEIN in kinds
+                else aln.ScoringMatrix.NUC
+            )
+
+        cells = aln.dp_cells(first.sequence.size, second.sequence.size, band)
+        if cells > MAX_DP_CELLS:
+            await interaction.followup.send(
+                "These sequences are too long to align, try a smaller band."
+            )
+            return
+
+        # Fall back to linear space when a traceback would not fit in memory.
+        score_only = score_only or cells > aln.MAX_TRACEBACK_CELLS
+
+        task = functools.partial(
+            aln.align,
+            first.sequence.tobytes(),
+            second.sequence.tobytes(),
+            mode,
+            matrix,
+            gap_open,
+            gap_extend,
+            band,
+            traceback=not score_only,
+        )
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self.executor, task)
+        except ValueError as error:
+            await interaction.followup.send(str(error))
+            return
+
+        pages = alignment_embeds(result, mode, matrix, first.header, second.header)
+        if len(pages) == 1:
+            await interaction.followup.send(embed=pages[0])
+            return
+
+        view = PaginatorView(author=interaction.user, interaction=interaction, pages=pages)
+        await interaction.followup.send(embed=view.first_page, view=view)
+
+
+async def _read_records(
+    interaction: discord.Interaction,
+    sequence_a: str | None,
+    sequence_b: str | None,
+    file: discord.Attachment | None,
+) -> tuple[seq.FastaRecord, seq.FastaRecord] | None:
+    """Read the two sequences to align for a deferred command, responds with an error if needed.
+
+    Parameters
+    ----------
+    interaction : discord.Interaction
+        The deferred interaction of the command.
+    sequence_a : str | None
+        The first pasted sequence.
+    sequence_b : str | None
+        The second pasted sequence.
+    file : discord.Attachment | None
+        The attached FASTA file.
+
+    Returns
+    -------
+    tuple[seq.FastaRecord, seq.FastaRecord] | None
+        The two records, or None if an error response was sent.
+    """
+    records: list[seq.FastaRecord] = []
+
+    if file is not None:
+        data = await read_attachment(interaction, file, MAX_ATTACHMENT_SIZE)
+        if data is None:
+            return None
+
+        records = await asyncio.to_thread(seq.parse_fasta, data)
+
+    for name, sequence in (("sequence A", sequence_a), ("sequence B", sequence_b)):
+        if sequence is not None:
+            records.append(seq.FastaRecord(name, seq.to_array(sequence)))
+
+    records = [record for record in records if record.sequence.size]
+    if len(records) < 2:  # noqa: PLR2004
+        await interaction.followup.send(
+            "Please provide two sequences, or a FASTA file containing them."
+        )
+        return None
+
+    return records[0], records[1]
+
+
+def alignment_embeds(
+    result: aln.Alignment,
+    mode: aln.AlignmentMode,
+    matrix: aln.ScoringMatrix,
+    header_a: str,
+    header_b: str,
+) -> list[discord.Embed]:
+    """Embeds to send for an alignment, a summary followed by pages of aligned blocks.
+
+    Parameters
+    ----------
+    result : aln.Alignment
+        The alignment to show.
+    mode : aln.AlignmentMode
+        The algorithm used.
+    matrix : aln.ScoringMatrix
+        The substitution matrix used.
+    header_a : str
+        Name of the first sequence.
+    header_b : str
+        Name of the second sequence.
+
+    Returns
+    -------
+    list[discord.Embed]
+        The pages to show.
+    """
+    summary = discord.Embed(
+        title=f"{mode.value} Alignment",
+        colour=0x3F3368,
+        timestamp=discord.utils.utcnow(),
+    )
+
+    summary.add_field(
+        name="Input",
+        value=f"```yml\nA: {header_a[:100]}\nB: {header_b[:100]}\nMatrix: {matrix.value}```",
+        inline=False,
+    )
+
+    if not result.length:
+        summary.add_field(
+            name="Result",
+            value=f"```yml\nScore: {result.score}\n"
+            f"End A: {result.end_a}\nEnd B: {result.end_b}```",
+            inline=False,
+        )
+        return [summary]
+
+    summary.add_field(
+        name="Result",
+        value=f"```yml\n"
+        f"Score: {result.score}\n"
+        f"Length: {result.length}\n"
+        f"Identity: {result.identities}/{result.length} "
+        f"({result.identities / result.length:.1%})\n"
+        f"Gaps: {result.gaps}/{result.length} ({result.gaps / result.length:.1%})\n"
+        f"A: {result.start_a + 1}-{result.end_a}\n"
+        f"B: {result.start_b + 1}-{result.end_b}```",
+        inline=False,
+    )
+
+    blocks: list[str] = []
+    position_a, position_b = result.start_a, result.start_b
+    for start in range(0, result.length, BLOCK_WIDTH):
+        row_a = result.aligned_a[start : start + BLOCK_WIDTH]
+        row_b = result.aligned_b[start : start + BLOCK_WIDTH]
+        matches = "".join("|" if a == b != "-" else " " for a, b in zip(row_a, row_b, strict=True))
+
+        blocks.append(
+            f"A {position_a + 1:>7} {row_a}\n  {'':>7} {matches}\nB {position_b + 1:>7} {row_b}"
+        )
+        position_a += len(row_a) - row_a.count("-")
+        position_b += len(row_b) - row_b.count("-")
+
+    pages = [summary]
+    pages.extend(
+        discord.Embed(
+            title=f"{mode.value} Alignment",
+            description="```\n" + "\n\n".join(blocks[start : start + BLOCKS_PER_PAGE]) + "```",
+            colour=0x3F3368,
+        )
+        for start in range(0, len(blocks), BLOCKS_PER_PAGE)
+    )
+
+    return pages
+
+
+async def setup(bot: BiochemieBot) -> None:
+    """Add Alignment cog."""
+    await bot.add_cog(Alignment(bot))
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+from typing import override
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+import config
+from biochemie_bot.bot import BiochemieBot
+from biochemie_bot.utils.kmer_index import KmerIndex, SearchResult
+from biochemie_bot.utils.views.paginator import PaginatorView
+
+MAX_HITS = 500
+HITS_PER_PAGE = 10
+
+
+class Database(commands.Cog):
+    """Includes commands to search the course reference database."""
+
+    def __init__(self, bot: BiochemieBot) -> None:
+        self.bot: BiochemieBot = bot
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.index: KmerIndex | None = None
+
+    @override
+    async def cog_load(self) -> None:
+        # Config files from before database search was added do not have this option.
+        kmer_index_path: str = getattr(config, "kmer_index_path", "")
+        if not kmer_index_path:
+            self.logger.info("No k-mer index configured, database search is disabled.")
+            return
+
+        try:
+            self.index = await asyncio.to_thread(KmerIndex.open, kmer_index_path)
+        except (OSError, ValueError, KeyError):
+            self.logger.exception("Failed to open k-mer index: %s", kmer_index_path)
+
+    database_group: app_commands.Group = app_commands.Group(
+        name="database", description="Search the reference sequence database."
+    )
+
+    @database_group.command()
+    @app_commands.describe(
+        query="The motif or sequence to search for, IUPAC ambiguity codes are allowed",
+        mismatches="Maximum amount of mismatching positions",
+    )
+    @app_commands.checks.cooldown(1, 5)
+    async def search(
+        self,
+        interaction: discord.Interaction,
+        query: app_commands.Range[str, 1, 1000],
+        mismatches: app_commands.Range[int, 0, 3] = 0,
+    ) -> None:
+        """Search the reference database for a motif, allowing for mismatches."""
+        if self.index is None:
+            await interaction.response.send_message(
+                "The reference database is not available.", ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(thinking=True)
+
+        try:
+            result = await asyncio.to_thread(self.index.search, query, mismatches, MAX_HITS)
+        except ValueError as error:
+            await interaction.followup.send(str(error))
+            return
+
+        if not result.hits:
+            await interaction.followup.send(f"No matches found for `{query}`.")
+            return
+
+        pages = search_embeds(result, query, mismatches)
+        if len(pages) == 1:
+            await interaction.followup.send(embed=pages[0])
+            return
+
+        view = PaginatorView(author=interaction.user, interaction=interaction, pages=pages)
+        await interaction.followup.send(embed=view.first_page, view=view)
+
+    @database_group.command()
+    async def info(self, interaction: discord.Interaction) -> None:
+        """Show information about the reference database."""
+        if self.index is None:
+            await interaction.response.send_message(
+                "The reference database is not available.", ephemeral=True
+            )
+            return
+
+        embed = discord.Embed(
+            title="Reference Database",
+            colour=0x3F3368,
+            timestamp=discord.utils.utcnow(),
+        )
+        embed.add_field(
+            name="Index",
+            value=f"```yml\n"
+            f"Type: {self.index.kind.value}\n"
+            f"Records: {self.index.record_count:,}\n"
+            f"Residues: {self.index.residue_count:,}\n"
+            f"k: {self.index.k}\n"
+            f"Indexed k-mers: {self.index.kmer_count:,}```",
+        )
+
+        await interaction.response.send_message(embed=embed)
+
+
+def search_embeds(result: SearchResult, query: str, mismatches: int) -> list[discord.Embed]:
+    """Embeds to send for a database search, with a page per :data:`HITS_PER_PAGE` hits.
+
+    Parameters
+    ----------
+    result : SearchResult
+        The search result to show.
+    query : str
+        The searched query.
+    mismatches : int
+        The maximum amount of mismatches used.
+
+    Returns
+    -------
+    list[discord.Embed]
+        The pages to show.
+    """
+    shown = (
+        f"{result.total:,} hits"
+        if result.total <= len(result.hits)
+        else f"{result.total:,} hits, showing the best {len(result.hits)}"
+    )
+
+    pages: list[discord.Embed] = []
+    for start in range(0, len(result.hits), HITS_PER_PAGE):
+        lines = [
+            f"{hit.header[:40]}\n  position {hit.position:,}, "
+            f"{hit.mismatches} mismatch(es)\n  {hit.match[:60]}"
+            for hit in result.hits[start : start + HITS_PER_PAGE]
+        ]
+        pages.append(
+            discord.Embed(
+                title="Database Search",
+                description=f"`{query[:100]}` with at most {mismatches} mismatch(es): {shown}"
+                "\n```\n" + "\n".join(lines) + "```",
+                colour=0x3F3368,
+            )
+        )
+
+    return pages
+
+
+async def setup(bot: BiochemieBot) -> None:
+    """Add Database cog."""
+    await bot.add_cog(Database(bot))
@@ -5,11 +5,36 @@
 from discord.ext import commands
 
 from biochemie_bot.bot import BiochemieBot
+from biochemie_bot.utils.autocomplete import TermCategory, default_index
 
 if TYPE_CHECKING:
     from discord.app_commands.models import AppCommand
 
 
+class Extension(commands.Converter[str]):
+    """Resolve an extension name, any unambiguous prefix of a cog module is accepted."""
+
+    @override
+    async def convert(self, ctx: commands.Context[BiochemieBot], argument: str) -> str:
+        index = default_index()
+
+        term = index.get(argument)
+        if term is not None and term.category is TermCategory.EXTENSION:
+            return term.name
+
+        matches = index.search(argument, (TermCategory.EXTENSION,))
+        if len(matches) == 1:
+            return matches[0].name
+
+        if matches:
+            suggestions = ", ".join(f"`{term.name}`" for term in matches)
+            msg = f"Extension `{argument}` is ambiguous, did you mean one of: {suggestions}?"
+            raise commands.BadArgument(msg)
+
+        # Leave unknown names to the extension loader, the module may be newer than the index.
+        return argument
+
+
 class Developer(commands.Cog):
     """Includes various developer-only commands."""
 
@@ -22,11 +47,28 @@ async def cog_check(self, ctx: commands.Context[BiochemieBot]) -> bool:
         return await self.bot.is_owner(ctx.author)
 
     @commands.command()
-    async def shutdown(self, ctx: commands.Context[BiochemieBot]) -> None:
-        """Shuts the bot down."""
+    async def shutdown(
+        self,
+        ctx: commands.Context[BiochemieBot],
+        deadline: float = commands.parameter(
+            default=30,
+            description="Seconds to wait for in-flight work before cancelling it",
+        ),
+    ) -> None:
+        """Drains in-flight work and shuts the bot down."""
         await ctx.send("Attempting to shut down cleanly...")
         self.logger.info("Shutdown: Manual")
 
+        report = await self.bot.drain(deadline=deadline)
+
+        await ctx.send(
+            f"Drained in {report.duration:.2f}s: "
+            f"{report.completed_tasks} task(s) completed, "
+            f"{report.cancelled_tasks} cancelled, "
+            f"{report.finalized_views} view(s) finalized, "
+            f"{report.flushed_buffers} buffer(s) flushed."
+        )
+
         await self.bot.close()
 
     @commands.command()
@@ -35,6 +77,7 @@ async def load(
         ctx: commands.Context[BiochemieBot],
         *,
         extension: str = commands.parameter(
+            converter=Extension,
             description="The extension to load",
         ),
     ) -> None:
@@ -52,6 +95,7 @@ async def unload(
         ctx: commands.Context[BiochemieBot],
         *,
         extension: str = commands.parameter(
+            converter=Extension,
             description="The extension to unload",
         ),
     ) -> None:
@@ -69,6 +113,7 @@ async def reload(
         ctx: commands.Context[BiochemieBot],
         *,
         extension: str = commands.parameter(
+            converter=Extension,
             default=None,
             description="The extension to reload, reloads all if nothing is specified",
         ),
@@ -0,0 +1,162 @@
+import asyncio
+import io
+import logging
+import re
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from biochemie_bot.bot import BiochemieBot
+from biochemie_bot.utils import formula as fml
+from biochemie_bot.utils.attachments import read_attachment
+from biochemie_bot.utils.autocomplete import TermCategory, default_index, term_autocomplete
+
+MAX_ATTACHMENT_SIZE = 4 * 2**20
+MAX_FORMULAS = 100_000
+
+_LIST_SEPARATOR = re.compile(r"[,;\n]")
+_COMPOUNDS = (TermCategory.AMINO_ACID, TermCategory.NUCLEOTIDE, TermCategory.METABOLITE)
+
+
+class Formula(commands.Cog):
+    """Includes molecular formula and molar mass commands."""
+
+    def __init__(self, bot: BiochemieBot) -> None:
+        self.bot: BiochemieBot = bot
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+    formula_group: app_commands.Group = app_commands.Group(
+        name="formula", description="Molecular formula commands."
+    )
+
+    @formula_group.command()
+    @app_commands.describe(
+        formula="A formula like C6H12O6, Ca(OH)2 or CuSO4·5H2O, or the name of a compound"
+    )
+    @app_commands.autocomplete(formula=term_autocomplete(*_COMPOUNDS))
+    async def mass(self, interaction: discord.Interaction, formula: str) -> None:  # noqa: PLR6301
+        """Calculate the molar mass and elemental composition of a formula."""
+        name = None
+        try:
+            parsed = fml.parse_formula(formula)
+        except ValueError as error:
+            # Not a formula, but possibly the name or abbreviation of a known compound.
+            term = default_index().get(formula)
+            if term is None or term.category not in _COMPOUNDS:
+                await interaction.response.send_message(str(error), ephemeral=True)
+                return
+
+            name, parsed = term.name, fml.parse_formula(term.detail)
+
+        await interaction.response.send_message(embed=formula_embed(parsed, name))
+
+    @formula_group.command()
+    @app_commands.describe(
+        formulas="Formulas separated by commas",
+        file="A text file with one formula per line",
+    )
+    @app_commands.checks.cooldown(1, 10)
+    async def batch(  # noqa: PLR6301
+        self,
+        interaction: discord.Interaction,
+        formulas: str | None = None,
+        file: discord.Attachment | None = None,
+    ) -> None:
+        """Calculate molar masses of many formulas at once, returned as a CSV file."""
+        await interaction.response.defer(thinking=True)
+
+        lines = await _read_lines(interaction, formulas, file)
+        if lines is None:
+            return
+
+        output = io.StringIO()
+        parsed, errors = await asyncio.to_thread(fml.write_csv, lines, output)
+
+        await interaction.followup.send(
+            f"Calculated the molar mass of {parsed} formula(s), {errors} could not be parsed.",
+            file=discord.File(io.BytesIO(output.getvalue().encode()), filename="formulas.csv"),
+        )
+
+
+async def _read_lines(
+    interaction: discord.Interaction, formulas: str | None, file: discord.Attachment | None
+) -> list[str] | None:
+    """Read the formulas given to a deferred command, responds with an error if not possible.
+
+    Parameters
+    ----------
+    interaction : discord.Interaction
+        The deferred interaction of the command.
+    formulas : str | None
+        The pasted formulas.
+    file : discord.Attachment | None
+        The attached file with one formula per line.
+
+    Returns
+    -------
+    list[str] | None
+        The formulas, or None if an error response was sent.
+    """
+    if file is not None:
+        data = await read_attachment(interaction, file, MAX_ATTACHMENT_SIZE)
+        if data is None:
+            return None
+
+        lines = data.decode(errors="replace").splitlines()
+    elif formulas is not None:
+        lines = _LIST_SEPARATOR.split(formulas)
+    else:
+        await interaction.followup.send(
+            "Please provide formulas or a file with one formula per line."
+        )
+        return None
+
+    if len(lines) > MAX_FORMULAS:
+        await interaction.followup.send(
+            f"At most {MAX_FORMULAS} formulas can be calculated at once."
+        )
+        return None
+
+    return lines
+
+
+def formula_embed(formula: fml.Formula, name: str | None = None) -> discord.Embed:
+    """Embed with the molar mass and composition of a formula.
+
+    Parameters
+    ----------
+    formula : fml.Formula
+        The parsed formula.
+    name : str | None
+        Name of the compound, if known.
+
+    Returns
+    -------
+    discord.Embed
+        The formatted embed.
+    """
+    embed = discord.Embed(
+        title=f"{name} ({formula.hill})" if name else formula.hill,
+        description=f"**Molar Mass:** {formula.molar_mass:.4f} g/mol",
+        colour=0x3F3368,
+    )
+
+    rows = "\n".join(
+        f"{symbol:<3}{count:>6}{count * fml.ATOMIC_WEIGHTS[symbol]:>12.4f}{fraction:>9.2%}"
+        for (symbol, count), (_symbol, fraction) in zip(
+            formula.counts, formula.mass_fractions(), strict=True
+        )
+    )
+    embed.add_field(
+        name="Composition",
+        value=f"```\n{'':<3}{'Atoms':>6}{'g/mol':>12}{'Mass':>9}\n{rows}```"[:1024],
+        inline=False,
+    )
+
+    return embed
+
+
+async def setup(bot: BiochemieBot) -> None:
+    """Add Formula cog."""
+    await bot.add_cog(Formula(bot))
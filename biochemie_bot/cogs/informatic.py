@@ -7,6 +7,7 @@
 
 from biochemie_bot.bot import BiochemieBot
 from biochemie_bot.utils import utils
+from biochemie_bot.utils.autocomplete import Term, TermCategory, default_index, term_autocomplete
 from biochemie_bot.utils.views.botinfo import BotInfoView, bot_info_embed
 
 if TYPE_CHECKING:
@@ -58,6 +59,54 @@ async def botinfo(self, interaction: discord.Interaction) -> None:
             ),
         )
 
+    @app_commands.command(name="term")
+    @app_commands.describe(
+        name="Name or abbreviation of an amino acid, nucleotide, metabolite or enzyme"
+    )
+    @app_commands.autocomplete(
+        name=term_autocomplete(
+            TermCategory.AMINO_ACID,
+            TermCategory.NUCLEOTIDE,
+            TermCategory.METABOLITE,
+            TermCategory.ENZYME,
+        )
+    )
+    async def term(self, interaction: discord.Interaction, name: str) -> None:  # noqa: PLR6301
+        """Look up abbreviations and the formula or EC number of a biochemistry term."""
+        term = default_index().get(name)
+        if term is None or term.category is TermCategory.EXTENSION:
+            await interaction.response.send_message(
+                f"Unknown term `{name[:100]}`, pick one of the suggestions.", ephemeral=True
+            )
+            return
+
+        await interaction.response.send_message(embed=term_embed(term))
+
+
+def term_embed(term: Term) -> discord.Embed:
+    """Embed describing a term.
+
+    Parameters
+    ----------
+    term : Term
+        The term to describe.
+
+    Returns
+    -------
+    discord.Embed
+        The formatted embed.
+    """
+    embed = discord.Embed(title=term.name, colour=0x3F3368)
+    embed.add_field(name="Category", value=term.category.value)
+
+    if term.aliases:
+        embed.add_field(name="Abbreviations", value=", ".join(term.aliases))
+
+    if term.detail:
+        embed.add_field(name=term.category.detail_label, value=term.detail)
+
+    return embed
+
 
 async def setup(bot: BiochemieBot) -> None:
     """Add Informatic cog."""
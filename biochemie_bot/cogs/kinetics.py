@@ -0,0 +1,170 @@
+import asyncio
+import functools
+import io
+import logging
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import override
+
+import aiohttp
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from biochemie_bot.bot import BiochemieBot
+from biochemie_bot.utils import kinetics
+from biochemie_bot.utils.kinetics import KineticsFit, KineticsModel
+
+MAX_ATTACHMENT_SIZE = 2**20
+MAX_WORKERS = 2
+CACHE_SIZE = 64
+
+type CacheKey = tuple[str, KineticsModel | None]
+
+
+class Kinetics(commands.Cog):
+    """Includes enzyme kinetics commands."""
+
+    def __init__(self, bot: BiochemieBot) -> None:
+        self.bot: BiochemieBot = bot
+        self.logger: logging.Logger = logging.getLogger(__name__)
+        self.executor: ProcessPoolExecutor | None = None
+        self.session: aiohttp.ClientSession | None = None
+        self.cache: OrderedDict[CacheKey, tuple[KineticsFit, bytes]] = OrderedDict()
+
+    @override
+    async def cog_load(self) -> None:
+        self.executor = ProcessPoolExecutor(
+            max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+        self.session = aiohttp.ClientSession()
+
+    @override
+    async def cog_unload(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    kinetics_group: app_commands.Group = app_commands.Group(
+        name="kinetics", description="Enzyme kinetics commands."
+    )
+
+    @kinetics_group.command(name="fit")
+    @app_commands.describe(
+        file="CSV file with substrate concentration, rate and optionally inhibitor concentration",
+        model="The rate equation to fit, picks the best fitting one by default",
+    )
+    @app_commands.checks.cooldown(1, 10)
+    async def fit(
+        self,
+        interaction: discord.Interaction,
+        file: discord.Attachment,
+        model: KineticsModel | None = None,
+    ) -> None:
+        """Fit Michaelis-Menten or inhibition kinetics to measured rates."""
+        if self.executor is None or self.session is None:
+            await interaction.response.send_message(
+                "Kinetics fitting is currently unavailable.", ephemeral=True
+            )
+            return
+
+        if file.size > MAX_ATTACHMENT_SIZE:
+            await interaction.response.send_message(
+                f"Files can be at most {MAX_ATTACHMENT_SIZE // 2**10} KiB.", ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(thinking=True)
+
+        parser = kinetics.CsvParser()
+        try:
+            async with self.session.get(file.url) as response:
+                response.raise_for_status()
+                async for line in response.content:
+                    parser.feed(line)
+        except aiohttp.ClientError:
+            self.logger.warning("Failed to download attachment: %s", file.url, exc_info=True)
+            await interaction.followup.send("Failed to read the attached file, please try again.")
+            return
+        except ValueError as error:
+            await interaction.followup.send(str(error))
+            return
+
+        data = parser.result()
+        key: CacheKey = (data.digest, model)
+
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            result, png = self.cache[key]
+        else:
+            try:
+                result, png = await asyncio.get_running_loop().run_in_executor(
+                    self.executor, functools.partial(kinetics.analyse, data, model)
+                )
+            except ValueError as error:
+                await interaction.followup.send(str(error))
+                return
+
+            self.cache[key] = (result, png)
+            if len(self.cache) > CACHE_SIZE:
+                self.cache.popitem(last=False)
+
+        await interaction.followup.send(
+            embed=kinetics_embed(result), file=discord.File(io.BytesIO(png), "kinetics.png")
+        )
+
+
+def kinetics_embed(result: KineticsFit) -> discord.Embed:
+    """Embed with the fitted parameters, showing the plot attached as `kinetics.png`.
+
+    Parameters
+    ----------
+    result : KineticsFit
+        The fit to show.
+
+    Returns
+    -------
+    discord.Embed
+        The formatted embed.
+    """
+    embed = discord.Embed(
+        title=f"Kinetics: {result.model.value}",
+        colour=0x3F3368,
+        timestamp=discord.utils.utcnow(),
+    )
+
+    embed.add_field(
+        name="Parameters (95% CI)",
+        value="```yml\n"
+        + "\n".join(
+            f"{parameter.name}: {parameter.value:.4g} ± {parameter.standard_error:.2g} "
+            f"({parameter.lower:.4g} to {parameter.upper:.4g})"
+            for parameter in result.parameters
+        )
+        + "```",
+        inline=False,
+    )
+
+    embed.add_field(
+        name="Goodness of Fit",
+        value=f"```yml\n"
+        f"R²: {result.r_squared:.4f}\n"
+        f"Sum of Squares: {result.sum_of_squares:.4g}\n"
+        f"AIC: {result.aic:.2f}\n"
+        f"Measurements: {result.observations}```",
+        inline=False,
+    )
+
+    embed.set_image(url="attachment://kinetics.png")
+
+    return embed
+
+
+async def setup(bot: BiochemieBot) -> None:
+    """Add Kinetics cog."""
+    await bot.add_cog(Kinetics(bot))
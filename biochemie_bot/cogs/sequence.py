@@ -0,0 +1,259 @@
+import asyncio
+import io
+import logging
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from biochemie_bot.bot import BiochemieBot
+from biochemie_bot.utils import sequence as seq
+from biochemie_bot.utils.attachments import read_attachment
+
+MAX_ATTACHMENT_SIZE = 16 * 2**20
+MAX_EMBED_RECORDS = 10
+MAX_INLINE_LENGTH = 1900
+FASTA_LINE_LENGTH = 60
+
+
+class Sequence(commands.Cog):
+    """Includes commands to calculate properties of DNA, RNA and protein sequences."""
+
+    def __init__(self, bot: BiochemieBot) -> None:
+        self.bot: BiochemieBot = bot
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+    sequence_group: app_commands.Group = app_commands.Group(
+        name="sequence", description="DNA, RNA and protein sequence commands."
+    )
+
+    @sequence_group.command()
+    @app_commands.describe(
+        sequence="The sequence to analyse", file="A (multi-record) FASTA file to analyse"
+    )
+    async def properties(  # noqa: PLR6301
+        self,
+        interaction: discord.Interaction,
+        sequence: str | None = None,
+        file: discord.Attachment | None = None,
+    ) -> None:
+        """Calculate molecular weight, pI, extinction coefficient or GC content."""
+        await interaction.response.defer(thinking=True)
+
+        records = await _read_records(interaction, sequence, file)
+        if records is None:
+            return
+
+        try:
+            rows = await asyncio.to_thread(_properties_rows, records)
+        except ValueError as error:
+            await interaction.followup.send(str(error))
+            return
+
+        if len(rows) > MAX_EMBED_RECORDS:
+            await interaction.followup.send(
+                f"Calculated properties of {len(rows)} records.",
+                file=discord.File(
+                    io.BytesIO(_properties_table(rows).encode()), filename="properties.tsv"
+                ),
+            )
+            return
+
+        embed = discord.Embed(title="Sequence Properties", colour=0x3F3368)
+        for header, values in rows:
+            embed.add_field(
+                name=header[:256],
+                value="```yml\n"
+                + "\n".join(f"{name}: {value}" for name, value in values.items())
+                + "```",
+                inline=False,
+            )
+
+        await interaction.followup.send(embed=embed)
+
+    @sequence_group.command(name="reverse-complement")
+    @app_commands.describe(
+        sequence="The DNA or RNA sequence",
+        file="A (multi-record) FASTA file to reverse complement",
+    )
+    async def reverse_complement(  # noqa: PLR6301
+        self,
+        interaction: discord.Interaction,
+        sequence: str | None = None,
+        file: discord.Attachment | None = None,
+    ) -> None:
+        """Reverse complement a DNA or RNA sequence."""
+        await interaction.response.defer(thinking=True)
+
+        records = await _read_records(interaction, sequence, file)
+        if records is None:
+            return
+
+        try:
+            results = await asyncio.to_thread(_reverse_complement_records, records)
+        except ValueError as error:
+            await interaction.followup.send(str(error))
+            return
+
+        await _send_records(interaction, results, "reverse_complement.fasta")
+
+    @sequence_group.command(name="translate")
+    @app_commands.describe(
+        sequence="The DNA or RNA sequence",
+        file="A (multi-record) FASTA file to translate",
+        frame="The reading frame to translate",
+    )
+    async def translate(  # noqa: PLR6301
+        self,
+        interaction: discord.Interaction,
+        sequence: str | None = None,
+        file: discord.Attachment | None = None,
+        frame: app_commands.Range[int, 1, 3] = 1,
+    ) -> None:
+        """Translate a DNA or RNA sequence into protein using the standard genetic code."""
+        await interaction.response.defer(thinking=True)
+
+        records = await _read_records(interaction, sequence, file)
+        if records is None:
+            return
+
+        try:
+            results = await asyncio.to_thread(_translate_records, records, frame - 1)
+        except ValueError as error:
+            await interaction.followup.send(str(error))
+            return
+
+        await _send_records(interaction, results, "translation.fasta")
+
+
+async def _read_records(
+    interaction: discord.Interaction, sequence: str | None, file: discord.Attachment | None
+) -> list[seq.FastaRecord] | None:
+    """Read the records given to a deferred command, responds with an error if there are none.
+
+    Parameters
+    ----------
+    interaction : discord.Interaction
+        The deferred interaction of the command.
+    sequence : str | None
+        The pasted sequence.
+    file : discord.Attachment | None
+        The attached FASTA file.
+
+    Returns
+    -------
+    list[seq.FastaRecord] | None
+        The parsed records, or None if an error response was sent.
+    """
+    if file is not None:
+        data = await read_attachment(interaction, file, MAX_ATTACHMENT_SIZE)
+        if data is None:
+            return None
+    elif sequence is not None:
+        data = sequence
+    else:
+        await interaction.followup.send("Please provide a sequence or a FASTA file.")
+        return None
+
+    records = await asyncio.to_thread(seq.parse_fasta, data)
+    if not records:
+        await interaction.followup.send("No sequences were found in the input.")
+        return None
+
+    return records
+
+
+def _properties_rows(records: list[seq.FastaRecord]) -> list[tuple[str, dict[str, str]]]:
+    rows: list[tuple[str, dict[str, str]]] = []
+
+    for record in records:
+        kind = seq.detect_kind(record.sequence)
+        if kind is seq.SequenceKind.PROTEIN:
+            protein = seq.protein_properties(record.sequence)
+            values = {
+                "Type": kind.value,
+                "Length": f"{protein.length:,} aa",
+                "Molecular Weight": f"{protein.molecular_weight:,.2f} Da",
+                "Isoelectric Point": f"{protein.isoelectric_point:.2f}",
+                "Ext. Coefficient (reduced)": f"{protein.extinction_coefficient_reduced:,}",
+                "Ext. Coefficient (cystines)": f"{protein.extinction_coefficient_oxidized:,}",
+            }
+        else:
+            nucleotide = seq.nucleotide_properties(record.sequence, kind)
+            values = {
+                "Type": kind.value,
+                "Length": f"{nucleotide.length:,} nt",
+                "Molecular Weight": f"{nucleotide.molecular_weight:,.2f} Da",
+                "GC Content": f"{nucleotide.gc_content:.2%}",
+            }
+
+        rows.append((record.header, values))
+
+    return rows
+
+
+def _properties_table(rows: list[tuple[str, dict[str, str]]]) -> str:
+    columns = list(dict.fromkeys(name for _header, values in rows for name in values))
+    lines = ["\t".join(["Record", *columns])]
+    lines.extend(
+        "\t".join([header, *(values.get(name, "") for name in columns)]) for header, values in rows
+    )
+    return "\n".join(lines) + "\n"
+
+
+def _check_nucleotide(record: seq.FastaRecord) -> None:
+    # Raises ValueError for invalid characters as well.
+    if seq.detect_kind(record.sequence) is seq.SequenceKind.PROTEIN:
+        msg = f"`{record.header[:100]}` is a protein sequence, expected DNA or RNA."
+        raise ValueError(msg)
+
+
+def _reverse_complement_records(records: list[seq.FastaRecord]) -> list[seq.FastaRecord]:
+    for record in records:
+        _check_nucleotide(record)
+
+    return [
+        seq.FastaRecord(
+            f"{record.header} reverse complement", seq.reverse_complement(record.sequence)
+        )
+        for record in records
+    ]
+
+
+def _translate_records(records: list[seq.FastaRecord], frame: int) -> list[seq.FastaRecord]:
+    for record in records:
+        _check_nucleotide(record)
+
+    return [
+        seq.FastaRecord(
+            f"{record.header} frame {frame + 1}", seq.translate(record.sequence, frame)
+        )
+        for record in records
+    ]
+
+
+async def _send_records(
+    interaction: discord.Interaction, records: list[seq.FastaRecord], filename: str
+) -> None:
+    """Send records inline if they are short enough, otherwise as a FASTA file."""
+    if len(records) == 1 and records[0].sequence.size <= MAX_INLINE_LENGTH:
+        await interaction.followup.send(
+            f"**{records[0].header}**\n```\n{records[0].sequence.tobytes().decode(errors='replace')}```"
+        )
+        return
+
+    fasta = io.StringIO()
+    for record in records:
+        body = record.sequence.tobytes().decode(errors="replace")
+        fasta.write(f">{record.header}\n")
+        for index in range(0, len(body), FASTA_LINE_LENGTH):
+            fasta.write(body[index : index + FASTA_LINE_LENGTH] + "\n")
+
+    await interaction.followup.send(
+        file=discord.File(io.BytesIO(fasta.getvalue().encode()), filename=filename)
+    )
+
+
+async def setup(bot: BiochemieBot) -> None:
+    """Add Sequence cog."""
+    await bot.add_cog(Sequence(bot))
@@ -0,0 +1,240 @@
+import asyncio
+import functools
+import io
+import logging
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from biochemie_bot.bot import BiochemieBot
+from biochemie_bot.utils import titration
+from biochemie_bot.utils.autocomplete import Term, TermCategory, TermIndex
+from biochemie_bot.utils.titration import Analyte, Titrant, TitrationCurve, TitrationParameters
+
+
+@functools.cache
+def preset_index() -> TermIndex:
+    """Build the autocomplete index of the preset analytes, only once.
+
+    Returns
+    -------
+    TermIndex
+        The shared index.
+    """
+    return TermIndex(
+        Term(
+            analyte.name,
+            TermCategory.AMINO_ACID if analyte.has_isoelectric_point else TermCategory.METABOLITE,
+            (),
+            "pKa " + ", ".join(f"{pka:g}" for pka in analyte.pkas),
+        )
+        for analyte in titration.PRESETS
+    )
+
+
+async def analyte_autocomplete(  # noqa: RUF029
+    _interaction: discord.Interaction, current: str
+) -> list[app_commands.Choice[str]]:
+    """Suggest preset analytes.
+
+    Parameters
+    ----------
+    _interaction : discord.Interaction
+        The interaction of the command.
+    current : str
+        What the user typed so far.
+
+    Returns
+    -------
+    list[app_commands.Choice[str]]
+        The matching presets.
+    """
+    return preset_index().choices(current)
+
+
+def resolve_analyte(text: str, charge: int) -> Analyte:
+    """Find a preset analyte by name, or create one from a list of pKa values.
+
+    Parameters
+    ----------
+    text : str
+        Name of a preset or comma separated pKa values.
+    charge : int
+        Charge of the fully protonated form, only used for pKa values.
+
+    Returns
+    -------
+    Analyte
+        The analyte, raises :class:`ValueError` if the text is neither.
+    """
+    term = preset_index().get(text)
+    if term is not None:
+        return next(analyte for analyte in titration.PRESETS if analyte.name == term.name)
+
+    pkas = titration.parse_pkas(text)
+    return Analyte("pKa " + ", ".join(f"{pka:g}" for pka in pkas), pkas, charge)
+
+
+class Titration(commands.Cog):
+    """Includes titration curve and buffer commands."""
+
+    def __init__(self, bot: BiochemieBot) -> None:
+        self.bot: BiochemieBot = bot
+        self.logger: logging.Logger = logging.getLogger(__name__)
+
+    titration_group: app_commands.Group = app_commands.Group(
+        name="titration", description="Titration and buffer commands."
+    )
+
+    @titration_group.command()
+    @app_commands.describe(
+        analyte="A preset acid or amino acid, or comma separated pKa values",
+        concentration="Concentration of the analyte in M",
+        volume="Volume of the analyte in mL",
+        titrant="Titrate the acid form with NaOH, or the base form with HCl",
+        titrant_concentration="Concentration of the titrant in M",
+        max_volume="Titrant to add in mL, by default just past the last equivalence point",
+        charge="Charge of the fully protonated form, only used for pKa values",
+    )
+    @app_commands.autocomplete(analyte=analyte_autocomplete)
+    @app_commands.checks.cooldown(1, 5)
+    async def curve(  # noqa: PLR0913, PLR0917, PLR6301
+        self,
+        interaction: discord.Interaction,
+        analyte: str,
+        concentration: app_commands.Range[float, 1e-4, 10.0] = 0.1,
+        volume: app_commands.Range[float, 1.0, 1000.0] = 25,
+        titrant: Titrant = Titrant.BASE,
+        titrant_concentration: app_commands.Range[float, 1e-4, 10.0] = 0.1,
+        max_volume: app_commands.Range[float, 1.0, 10_000.0] | None = None,
+        charge: app_commands.Range[int, -6, 6] = 0,
+    ) -> None:
+        """Simulate the titration curve of a (polyprotic) acid or amino acid."""
+        try:
+            resolved = resolve_analyte(analyte, charge)
+        except ValueError as error:
+            await interaction.response.send_message(str(error), ephemeral=True)
+            return
+
+        if max_volume is None:
+            equivalence = concentration * volume / titrant_concentration
+            max_volume = (len(resolved.pkas) + 0.5) * equivalence
+
+        parameters = TitrationParameters(
+            resolved, concentration, volume, titrant, titrant_concentration, max_volume
+        )
+
+        await interaction.response.defer(thinking=True)
+
+        result, png = await asyncio.to_thread(titration.analyse, parameters)
+
+        await interaction.followup.send(
+            embed=titration_embed(parameters, result),
+            file=discord.File(io.BytesIO(png), "titration.png"),
+        )
+
+    @titration_group.command()
+    @app_commands.describe(
+        analyte="A preset acid or amino acid, or comma separated pKa values",
+        ph="The pH of the buffer",
+        concentration="Total concentration of the buffering acid in M",
+        charge="Charge of the fully protonated form, only used for pKa values",
+    )
+    @app_commands.autocomplete(analyte=analyte_autocomplete)
+    async def buffer(  # noqa: PLR6301
+        self,
+        interaction: discord.Interaction,
+        analyte: str,
+        ph: app_commands.Range[float, 0.0, 14.0],
+        concentration: app_commands.Range[float, 1e-4, 10.0] = 0.1,
+        charge: app_commands.Range[int, -6, 6] = 0,
+    ) -> None:
+        """Show the species distribution and buffer capacity at a pH."""
+        try:
+            resolved = resolve_analyte(analyte, charge)
+        except ValueError as error:
+            await interaction.response.send_message(str(error), ephemeral=True)
+            return
+
+        state = titration.buffer_state(resolved, concentration, ph)
+
+        embed = discord.Embed(title=f"Buffer: {resolved.name}", colour=0x3F3368)
+        embed.add_field(
+            name="Species",
+            value="```yml\n"
+            + "\n".join(
+                f"Charge {resolved.charge - removed:+d}: {fraction:.2%} "
+                f"({fraction * concentration:.4g} M)"
+                for removed, fraction in enumerate(state.fractions)
+            )
+            + "```",
+            inline=False,
+        )
+        embed.add_field(
+            name="Henderson-Hasselbalch",
+            value="```yml\n"
+            + "\n".join(
+                f"pKa {pka:g}: [base]/[acid] = {10 ** (ph - pka):.3g}" for pka in resolved.pkas
+            )
+            + "```",
+            inline=False,
+        )
+        embed.add_field(
+            name="Buffer",
+            value=f"```yml\npH: {ph:g}\n"
+            f"Mean Charge: {state.mean_charge:+.2f}\n"
+            f"Capacity: {state.capacity * 1000:.2f} mM/pH```",
+            inline=False,
+        )
+
+        await interaction.response.send_message(embed=embed)
+
+
+def titration_embed(parameters: TitrationParameters, curve: TitrationCurve) -> discord.Embed:
+    """Embed with the setup and key points of a titration, showing `titration.png`.
+
+    Parameters
+    ----------
+    parameters : TitrationParameters
+        The simulated titration.
+    curve : TitrationCurve
+        The simulated curve.
+
+    Returns
+    -------
+    discord.Embed
+        The formatted embed.
+    """
+    embed = discord.Embed(
+        title=f"Titration: {parameters.analyte.name}",
+        colour=0x3F3368,
+        timestamp=discord.utils.utcnow(),
+    )
+
+    embed.add_field(
+        name="Setup",
+        value=f"```yml\n"
+        f"Analyte: {parameters.concentration:g} M, {parameters.volume:g} mL\n"
+        f"pKa: {', '.join(f'{pka:g}' for pka in parameters.analyte.pkas)}\n"
+        f"Titrant: {parameters.titrant_concentration:g} M {parameters.titrant.value}```",
+        inline=False,
+    )
+
+    points = sorted(
+        curve.equivalence_points + curve.half_equivalence_points, key=lambda point: point.volume
+    )
+    lines = [f"Start: pH {curve.ph[0]:.2f}"]
+    lines.extend(f"{point.label}: {point.volume:.2f} mL, pH {point.ph:.2f}" for point in points)
+    if curve.isoelectric_point is not None:
+        lines.append(f"pI: {curve.isoelectric_point:.2f}")
+
+    embed.add_field(name="Key Points", value="```yml\n" + "\n".join(lines) + "```", inline=False)
+    embed.set_image(url="attachment://titration.png")
+
+    return embed
+
+
+async def setup(bot: BiochemieBot) -> None:
+    """Add Titration cog."""
+    await bot.add_cog(Titration(bot))
@@ -0,0 +1,443 @@
+import functools
+from enum import Enum
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+MAX_TRACEBACK_CELLS = 50_000_000
+
+_NEG = -(2**40)
+
+_BLOSUM62 = """
+     A  R  N  D  C  Q  E  G  H  I  L  K  M  F  P  S  T  W  Y  V  B  Z  X  *
+  A  4 -1 -2 -2  0 -1 -1  0 -2 -1 -1 -1 -1 -2 -1  1  0 -3 -2  0 -2 -1  0 -4
+  R -1  5  0 -2 -3  1  0 -2  0 -3 -2  2 -1 -3 -2 -1 -1 -3 -2 -3 -1  0 -1 -4
+  N -2  0  6  1 -3  0  0  0  1 -3 -3  0 -2 -3 -2  1  0 -4 -2 -3  3  0 -1 -4
+  D -2 -2  1  6 -3  0  2 -1 -1 -3 -4 -1 -3 -3 -1  0 -1 -4 -3 -3  4  1 -1 -4
+  C  0 -3 -3 -3  9 -3 -4 -3 -3 -1 -1 -3 -1 -2 -3 -1 -1 -2 -2 -1 -3 -3 -2 -4
+  Q -1  1  0  0 -3  5  2 -2  0 -3 -2  1  0 -3 -1  0 -1 -2 -1 -2  0  3 -1 -4
+  E -1  0  0  2 -4  2  5 -2  0 -3 -3  1 -2 -3 -1  0 -1 -3 -2 -2  1  4 -1 -4
+  G  0 -2  0 -1 -3 -2 -2  6 -2 -4 -4 -2 -3 -3 -2  0 -2 -2 -3 -3 -1 -2 -1 -4
+  H -2  0  1 -1 -3  0  0 -2  8 -3 -3 -1 -2 -1 -2 -1 -2 -2  2 -3  0  0 -1 -4
+  I -1 -3 -3 -3 -1 -3 -3 -4 -3  4  2 -3  1  0 -3 -2 -1 -3 -1  3 -3 -3 -1 -4
+  L -1 -2 -3 -4 -1 -2 -3 -4 -3  2  4 -2  2  0 -3 -2 -1 -2 -1  1 -4 -3 -1 -4
+  K -1  2  0 -1 -3  1  1 -2 -1 -3 -2  5 -1 -3 -1  0 -1 -3 -2 -2  0  1 -1 -4
+  M -1 -1 -2 -3 -1  0 -2 -3 -2  1  2 -1  5  0 -2 -1 -1 -1 -1  1 -3 -1 -1 -4
+  F -2 -3 -3 -3 -2 -3 -3 -3 -1  0  0 -3  0  6 -4 -2 -2  1  3 -1 -3 -3 -1 -4
+  P -1 -2 -2 -1 -3 -1 -1 -2 -2 -3 -3 -1 -2 -4  7 -1 -1 -4 -3 -2 -2 -1 -2 -4
+  S  1 -1  1  0 -1  0  0  0 -1 -2 -2  0 -1 -2 -1  4  1 -3 -2 -2  0  0  0 -4
+  T  0 -1  0 -1 -1 -1 -1 -2 -2 -1 -1 -1 -1 -2 -1  1  5 -2 -2  0 -1 -1  0 -4
+  W -3 -3 -4 -4 -2 -2 -3 -2 -2 -3 -2 -3 -1  1 -4 -3 -2 11  2 -3 -4 -3 -2 -4
+  Y -2 -2 -2 -3 -2 -1 -2 -3  2 -1 -1 -2 -1  3 -3 -2 -2  2  7 -1 -3 -2 -1 -4
+  V  0 -3 -3 -3 -1 -2 -2 -3 -3  3  1 -2  1 -1 -2 -2  0 -3 -1  4 -3 -2 -1 -4
+  B -2 -1  3  4 -3  0  1 -1  0 -3 -4  0 -3 -3 -2  0 -1 -4 -3 -3  4  1 -1 -4
+  Z -1  0  0  1 -3  3  4 -2  0 -3 -3  1 -1 -3 -1  0 -1 -3 -2 -2  1  4 -1 -4
+  X  0 -1 -1 -1 -2 -1 -1 -1 -1 -1 -1 -1 -1 -1 -2  0  0 -2 -1 -1 -1 -1 -1 -4
+  * -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4 -4  1
+"""
+_PAM250 = """
+     A  R  N  D  C  Q  E  G  H  I  L  K  M  F  P  S  T  W  Y  V  B  Z  X  *
+  A  2 -2  0  0 -2  0  0  1 -1 -1 -2 -1 -1 -3  1  1  1 -6 -3  0  0  0  0 -8
+  R -2  6  0 -1 -4  1 -1 -3  2 -2 -3  3  0 -4  0  0 -1  2 -4 -2 -1  0 -1 -8
+  N  0  0  2  2 -4  1  1  0  2 -2 -3  1 -2 -3  0  1  0 -4 -2 -2  2  1  0 -8
+  D  0 -1  2  4 -5  2  3  1  1 -2 -4  0 -3 -6 -1  0  0 -7 -4 -2  3  3 -1 -8
+  C -2 -4 -4 -5 12 -5 -5 -3 -3 -2 -6 -5 -5 -4 -3  0 -2 -8  0 -2 -4 -5 -3 -8
+  Q  0  1  1  2 -5  4  2 -1  3 -2 -2  1 -1 -5  0 -1 -1 -5 -4 -2  1  3 -1 -8
+  E  0 -1  1  3 -5  2  4  0  1 -2 -3  0 -2 -5 -1  0  0 -7 -4 -2  3  3 -1 -8
+  G  1 -3  0  1 -3 -1  0  5 -2 -3 -4 -2 -3 -5  0  1  0 -7 -5 -1  0  0 -1 -8
+  H -1  2  2  1 -3  3  1 -2  6 -2 -2  0 -2 -2  0 -1 -1 -3  0 -2  1  2 -1 -8
+  I -1 -2 -2 -2 -2 -2 -2 -3 -2  5  2 -2  2  1 -2 -1  0 -5 -1  4 -2 -2 -1 -8
+  L -2 -3 -3 -4 -6 -2 -3 -4 -2  2  6 -3  4  2 -3 -3 -2 -2 -1  2 -3 -3 -1 -8
+  K -1  3  1  0 -5  1  0 -2  0 -2 -3  5  0 -5 -1  0  0 -3 -4 -2  1  0 -1 -8
+  M -1  0 -2 -3 -5 -1 -2 -3 -2  2  4  0  6  0 -2 -2 -1 -4 -2  2 -2 -2 -1 -8
+  F -3 -4 -3 -6 -4 -5 -5 -5 -2  1  2 -5  0  9 -5 -3 -3  0  7 -1 -4 -5 -2 -8
+  P  1  0  0 -1 -3  0 -1  0  0 -2 -3 -1 -2 -5  6  1  0 -6 -5 -1 -1  0 -1 -8
+  S  1  0  1  0  0 -1  0  1 -1 -1 -3  0 -2 -3  1  2  1 -2 -3 -1  0  0  0 -8
+  T  1 -1  0  0 -2 -1  0  0 -1  0 -2  0 -1 -3  0  1  3 -5 -3  0  0 -1  0 -8
+  W -6  2 -4 -7 -8 -5 -7 -7 -3 -5 -2 -3 -4  0 -6 -2 -5 17  0 -6 -5 -6 -4 -8
+  Y -3 -4 -2 -4  0 -4 -4 -5  0 -1 -1 -4 -2  7 -5 -3 -3  0 10 -2 -3 -4 -2 -8
+  V  0 -2 -2 -2 -2 -2 -2 -1 -2  4  2 -2  2 -1 -1 -1  0 -6 -2  4 -2 -2 -1 -8
+  B  0 -1  2  3 -4  1  3  0  1 -2 -3  1 -2 -4 -1  0  0 -5 -3 -2  3  2 -1 -8
+  Z  0  0  1  3 -5  3  3  0  2 -2 -3  0 -2 -5  0  0 -1 -6 -4 -2  2  3 -1 -8
+  X  0 -1  0 -1 -3 -1 -1 -1 -1 -1 -1 -1 -1 -2 -1  0  0 -4 -2 -1 -1 -1 -1 -8
+  * -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8 -8  1
+"""
+
+_NUCLEOTIDES = b"ACGTN"
+_NUCLEOTIDE_MATCH = 5
+_NUCLEOTIDE_MISMATCH = -4
+
+_SOURCE_DIAGONAL = 0
+_SOURCE_VERTICAL = 1
+_SOURCE_HORIZONTAL = 2
+_SOURCE_STOP = 3
+_VERTICAL_EXTENDED = 4
+_HORIZONTAL_EXTENDED = 8
+
+
+class AlignmentMode(Enum):
+    """Alignment algorithm to use."""
+
+    GLOBAL = "Needleman-Wunsch"
+    LOCAL = "Smith-Waterman"
+
+
+class ScoringMatrix(Enum):
+    """Available substitution matrices."""
+
+    BLOSUM62 = "BLOSUM62"
+    PAM250 = "PAM250"
+    NUC = "NUC"
+
+
+class Alignment(NamedTuple):
+    """Result of a pairwise alignment.
+
+    The aligned sequences are empty when only the score was computed. Start and end positions
+    are 0-based and half-open.
+    """
+
+    score: int
+    aligned_a: str
+    aligned_b: str
+    start_a: int
+    end_a: int
+    start_b: int
+    end_b: int
+
+    @property
+    def length(self) -> int:
+        """Amount of columns in the alignment."""
+        return len(self.aligned_a)
+
+    @property
+    def identities(self) -> int:
+        """Amount of columns with identical residues."""
+        return sum(a == b != "-" for a, b in zip(self.aligned_a, self.aligned_b, strict=True))
+
+    @property
+    def gaps(self) -> int:
+        """Amount of columns containing a gap."""
+        return self.aligned_a.count("-") + self.aligned_b.count("-")
+
+
+@functools.cache
+def load_matrix(matrix: ScoringMatrix) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.int64]]:
+    """Load a substitution matrix.
+
+    Parameters
+    ----------
+    matrix : ScoringMatrix
+        The matrix to load.
+
+    Returns
+    -------
+    tuple[npt.NDArray[np.intp], npt.NDArray[np.int64]]
+        A 256-entry table mapping bytes onto matrix indices, and the square score matrix.
+        Unknown residues map onto ``X`` (or ``N`` for nucleotides).
+    """
+    if matrix is ScoringMatrix.NUC:
+        alphabet = _NUCLEOTIDES
+        scores = np.full((len(alphabet), len(alphabet)), _NUCLEOTIDE_MISMATCH, dtype=np.int64)
+        np.fill_diagonal(scores, _NUCLEOTIDE_MATCH)
+        scores[-1, :] = scores[:, -1] = 0
+        unknown = alphabet.index(b"N")
+    else:
+        text = _BLOSUM62 if matrix is ScoringMatrix.BLOSUM62 else _PAM250
+        header, *rows = text.strip().splitlines()
+        alphabet = "".join(header.split()).encode()
+        scores = np.array([row.split()[1:] for row in rows], dtype=np.int64)
+        unknown = alphabet.index(b"X")
+
+    index = np.full(256, unknown, dtype=np.intp)
+    for position, char in enumerate(alphabet):
+        index[char] = position
+        index[ord(chr(char).lower())] = position
+    if matrix is ScoringMatrix.NUC:
+        index[ord("U")] = index[ord("u")] = alphabet.index(b"T")
+
+    return index, scores
+
+
+def dp_cells(length_a: int, length_b: int, band: int | None = None) -> int:
+    """Calculate how many cells of the DP matrix an alignment would fill.
+
+    Parameters
+    ----------
+    length_a : int
+        Length of the first sequence.
+    length_b : int
+        Length of the second sequence.
+    band : int | None
+        Band width, see :func:`align`.
+
+    Returns
+    -------
+    int
+        The amount of cells.
+    """
+    n, m = sorted((length_a, length_b))
+    if band is None or n == 0:
+        return n * m
+
+    los, his = _band_bounds(n, m, band)
+    return int((his[1:] - los[1:]).sum())
+
+
+def align(  # noqa: PLR0913, PLR0917
+    sequence_a: bytes,
+    sequence_b: bytes,
+    mode: AlignmentMode = AlignmentMode.GLOBAL,
+    matrix: ScoringMatrix = ScoringMatrix.BLOSUM62,
+    gap_open: int = 10,
+    gap_extend: int = 1,
+    band: int | None = None,
+    *,
+    traceback: bool = True,
+) -> Alignment:
+    """Align two sequences with affine gap penalties.
+
+    The DP matrix is filled one row at a time with NumPy, the horizontal gap recurrence within a
+    row is solved with a cumulative maximum. Without traceback only two rows are kept in memory.
+
+    Parameters
+    ----------
+    sequence_a : bytes
+        The first sequence.
+    sequence_b : bytes
+        The second sequence.
+    mode : AlignmentMode
+        Global (Needleman-Wunsch) or local (Smith-Waterman) alignment.
+    matrix : ScoringMatrix
+        The substitution matrix.
+    gap_open : int
+        Penalty of the first position of a gap, must be at least ``gap_extend``.
+    gap_extend : int
+        Penalty of every following position of a gap.
+    band : int | None
+        Only fill cells within this distance of the (scaled) diagonal, which is much faster for
+        long, similar sequences. The result is only optimal if the best path lies within the band.
+    traceback : bool
+        Whether to compute the aligned sequences, or only the score.
+
+    Returns
+    -------
+    Alignment
+        The optimal alignment.
+
+    Raises
+    ------
+    ValueError
+        Invalid gap penalties, or the traceback would use too much memory.
+    """
+    if gap_extend < 0 or gap_open < gap_extend:
+        msg = "Gap penalties must satisfy 0 <= gap_extend <= gap_open."
+        raise ValueError(msg)
+
+    swapped = len(sequence_a) > len(sequence_b)
+    if swapped:
+        sequence_a, sequence_b = sequence_b, sequence_a
+
+    result = _align(sequence_a, sequence_b, mode, matrix, gap_open, gap_extend, band, traceback)
+
+    if swapped:
+        return Alignment(
+            score=result.score,
+            aligned_a=result.aligned_b,
+            aligned_b=result.aligned_a,
+            start_a=result.start_b,
+            end_a=result.end_b,
+            start_b=result.start_a,
+            end_b=result.end_a,
+        )
+    return result
+
+
+def _band_bounds(n: int, m: int, band: int) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    # Column range [lo, hi) of every row, consecutive bands have to overlap or no path could
+    # connect them. Rows must not outnumber columns.
+    band = max(band, -(-m // n))
+    centers = np.arange(n + 1, dtype=np.intp) * m // n
+    los = np.maximum(1, centers - band)
+    his = np.minimum(m, centers + band) + 1
+    return los, his
+
+
+def _align(  # noqa: PLR0912, PLR0913, PLR0914, PLR0915, PLR0917
+    sequence_a: bytes,
+    sequence_b: bytes,
+    mode: AlignmentMode,
+    matrix: ScoringMatrix,
+    gap_open: int,
+    gap_extend: int,
+    band: int | None,
+    traceback: bool,  # noqa: FBT001
+) -> Alignment:
+    index, scores = load_matrix(matrix)
+    a = index[np.frombuffer(sequence_a, dtype=np.uint8)]
+    b = index[np.frombuffer(sequence_b, dtype=np.uint8)]
+    n, m = a.size, b.size
+    local = mode is AlignmentMode.LOCAL
+
+    if n == 0:
+        if local:
+            return Alignment(0, "", "", 0, 0, 0, 0)
+        score = -(gap_open + (m - 1) * gap_extend) if m else 0
+        return Alignment(score, "-" * m, sequence_b.decode(), 0, 0, 0, m)
+
+    if band is None:
+        los = np.ones(n + 1, dtype=np.intp)
+        his = np.full(n + 1, m + 1, dtype=np.intp)
+    else:
+        los, his = _band_bounds(n, m, band)
+
+    widths = his - los
+    if traceback:
+        if n * int(widths.max()) > MAX_TRACEBACK_CELLS:
+            msg = "Sequences are too long for a full alignment, use a band or only the score."
+            raise ValueError(msg)
+        trace = np.zeros((n + 1, int(widths.max())), dtype=np.uint8)
+    else:
+        trace = None
+
+    ramp = np.arange(m + 1, dtype=np.int64) * gap_extend
+    gap_costs = ramp - gap_extend + gap_open
+
+    h_prev = np.full(m + 1, _NEG, dtype=np.int64)
+    f_prev = np.full(m + 1, _NEG, dtype=np.int64)
+    h_cur = np.full(m + 1, _NEG, dtype=np.int64)
+    f_cur = np.full(m + 1, _NEG, dtype=np.int64)
+
+    if local:
+        h_prev[:] = 0
+    else:
+        h_prev[0] = 0
+        h_prev[1:] = -gap_costs[1:]
+    written = [(0, 0), (0, m + 1)]
+
+    best_score, best_i, best_j = 0, 0, 0
+
+    for i in range(1, n + 1):
+        lo, hi = int(los[i]), int(his[i])
+        width = hi - lo
+
+        # Clear the slice this buffer held two rows ago.
+        start, stop = written[0]
+        h_cur[start:stop] = _NEG
+        f_cur[start:stop] = _NEG
+
+        if lo == 1:
+            h_cur[0] = 0 if local else -gap_costs[i]
+
+        diagonal = h_prev[lo - 1 : hi - 1] + scores[a[i - 1]][b[lo - 1 : hi - 1]]
+        vertical_open = h_prev[lo:hi] - gap_open
+        vertical_extend = f_prev[lo:hi] - gap_extend
+        vertical = np.maximum(vertical_open, vertical_extend)
+
+        without_horizontal = np.maximum(diagonal, vertical)
+        if local:
+            np.maximum(without_horizontal, 0, out=without_horizontal)
+
+        sources = np.empty(width, dtype=np.int64)
+        sources[0] = h_cur[lo - 1]
+        sources[1:] = without_horizontal[:-1]
+        horizontal = np.maximum.accumulate(sources + ramp[:width]) - ramp[:width] - gap_open
+
+        row = np.maximum(without_horizontal, horizontal)
+        h_cur[lo:hi] = row
+        f_cur[lo:hi] = vertical
+        written = [written[1], (0 if lo == 1 else lo, hi)]
+
+        if trace is not None:
+            bits = np.where(
+                row == diagonal,
+                _SOURCE_DIAGONAL,
+                np.where(row == vertical, _SOURCE_VERTICAL, _SOURCE_HORIZONTAL),
+            ).astype(np.uint8)
+            if local:
+                bits[row == 0] = _SOURCE_STOP
+            bits[vertical_extend > vertical_open] |= _VERTICAL_EXTENDED
+            horizontal_extend = np.empty(width, dtype=np.int64)
+            horizontal_extend[0] = _NEG
+            horizontal_extend[1:] = horizontal[:-1] - gap_extend
+            bits[horizontal_extend > sources - gap_open] |= _HORIZONTAL_EXTENDED
+            trace[i, :width] = bits
+
+        if local:
+            column = int(np.argmax(row))
+            if row[column] > best_score:
+                best_score, best_i, best_j = int(row[column]), i, lo + column
+
+        h_prev, h_cur = h_cur, h_prev
+        f_prev, f_cur = f_cur, f_prev
+
+    if not local:
+        best_score, best_i, best_j = int(h_prev[m]), n, m
+
+    if trace is None:
+        return Alignment(best_score, "", "", 0, best_i, 0, best_j)
+
+    return _traceback(sequence_a, sequence_b, trace, los, best_score, best_i, best_j, local)
+
+
+def _traceback(  # noqa: PLR0913, PLR0917
+    sequence_a: bytes,
+    sequence_b: bytes,
+    trace: npt.NDArray[np.uint8],
+    los: npt.NDArray[np.intp],
+    score: int,
+    i: int,
+    j: int,
+    local: bool,  # noqa: FBT001
+) -> Alignment:
+    end_a, end_b = i, j
+    text_a, text_b = sequence_a.decode(), sequence_b.decode()
+    aligned_a: list[str] = []
+    aligned_b: list[str] = []
+    state = _SOURCE_DIAGONAL
+
+    while i > 0 and j > 0:
+        bits = int(trace[i, j - los[i]])
+
+        if state == _SOURCE_DIAGONAL:
+            source = bits & 3
+            if source == _SOURCE_STOP:
+                break
+            if source != _SOURCE_DIAGONAL:
+                state = source
+                continue
+
+            aligned_a.append(text_a[i - 1])
+            aligned_b.append(text_b[j - 1])
+            i -= 1
+            j -= 1
+        elif state == _SOURCE_VERTICAL:
+            aligned_a.append(text_a[i - 1])
+            aligned_b.append("-")
+            i -= 1
+            if not bits & _VERTICAL_EXTENDED:
+                state = _SOURCE_DIAGONAL
+        else:
+            aligned_a.append("-")
+            aligned_b.append(text_b[j - 1])
+            j -= 1
+            if not bits & _HORIZONTAL_EXTENDED:
+                state = _SOURCE_DIAGONAL
+
+    if not local:
+        aligned_a.extend(reversed(text_a[:i]))
+        aligned_b.extend("-" * i)
+        aligned_a.extend("-" * j)
+        aligned_b.extend(reversed(text_b[:j]))
+        i = j = 0
+
+    return Alignment(
+        score=score,
+        aligned_a="".join(reversed(aligned_a)),
+        aligned_b="".join(reversed(aligned_b)),
+        start_a=i,
+        end_a=end_a,
+        start_b=j,
+        end_b=end_b,
+    )
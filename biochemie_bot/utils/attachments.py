@@ -0,0 +1,39 @@
+import logging
+
+import discord
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+async def read_attachment(
+    interaction: discord.Interaction, file: discord.Attachment, max_size: int
+) -> bytes | None:
+    """Download an attachment given to a command, responds with an error if that fails.
+
+    The interaction has to be deferred already, downloading a large attachment can take longer
+    than Discord waits for the initial response. Errors are therefore sent as followups.
+
+    Parameters
+    ----------
+    interaction : discord.Interaction
+        The deferred interaction of the command.
+    file : discord.Attachment
+        The attachment to read.
+    max_size : int
+        Maximum size of the attachment in bytes.
+
+    Returns
+    -------
+    bytes | None
+        The contents of the attachment, or None if an error response was sent.
+    """
+    if file.size > max_size:
+        await interaction.followup.send(f"Files can be at most {max_size / 2**20:g} MiB.")
+        return None
+
+    try:
+        return await file.read()
+    except discord.HTTPException:
+        logger.warning("Failed to read attachment: %s", file.url, exc_info=True)
+        await interaction.followup.send("Failed to read the attached file, please try again.")
+        return None
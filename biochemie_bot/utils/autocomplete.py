@@ -0,0 +1,433 @@
+import bisect
+import functools
+import heapq
+import itertools
+import pkgutil
+import re
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from enum import Enum
+from typing import Any, NamedTuple
+
+import discord
+from discord import app_commands
+
+import biochemie_bot.cogs
+
+MAX_CHOICES = 25
+MAX_CHOICE_LENGTH = 100
+
+# Matches the unbound form of discord.py's own autocomplete callback type.
+type AutocompleteCallback = Callable[
+    [discord.Interaction[Any], str], Coroutine[Any, Any, list[app_commands.Choice[str]]]
+]
+
+_WORD_START = re.compile(r"(?<=[\s,\-(])\w")
+
+
+class TermCategory(Enum):
+    """The kinds of terms that can be suggested."""
+
+    AMINO_ACID = "Amino Acid"
+    NUCLEOTIDE = "Nucleotide"
+    METABOLITE = "Metabolite"
+    ENZYME = "Enzyme"
+    EXTENSION = "Extension"
+
+    @property
+    def detail_label(self) -> str:
+        """What the detail of a term in this category describes."""
+        match self:
+            case TermCategory.ENZYME:
+                return "EC Number"
+            case TermCategory.EXTENSION:
+                return "Module"
+            case _:
+                return "Formula"
+
+
+class Term(NamedTuple):
+    """A suggestable term together with its abbreviations."""
+
+    name: str
+    category: TermCategory
+    aliases: tuple[str, ...] = ()
+    detail: str = ""
+
+    @property
+    def label(self) -> str:
+        """The name shown in an autocomplete suggestion."""
+        label = f"{self.name} ({', '.join(self.aliases)})" if self.aliases else self.name
+        if self.detail:
+            label = f"{label} - {self.detail}"
+
+        return label[:MAX_CHOICE_LENGTH]
+
+
+# Name, abbreviations and formula of the free (neutral) amino acid.
+_AMINO_ACIDS: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("Alanine", ("Ala", "A"), "C3H7NO2"),
+    ("Arginine", ("Arg", "R"), "C6H14N4O2"),
+    ("Asparagine", ("Asn", "N"), "C4H8N2O3"),
+    ("Aspartic acid", ("Asp", "D", "Aspartate"), "C4H7NO4"),
+    ("Cysteine", ("Cys", "C"), "C3H7NO2S"),
+    ("Glutamic acid", ("Glu", "E", "Glutamate"), "C5H9NO4"),
+    ("Glutamine", ("Gln", "Q"), "C5H10N2O3"),
+    ("Glycine", ("Gly", "G"), "C2H5NO2"),
+    ("Histidine", ("His", "H"), "C6H9N3O2"),
+    ("Isoleucine", ("Ile", "I"), "C6H13NO2"),
+    ("Leucine", ("Leu", "L"), "C6H13NO2"),
+    ("Lysine", ("Lys", "K"), "C6H14N2O2"),
+    ("Methionine", ("Met", "M"), "C5H11NO2S"),
+    ("Phenylalanine", ("Phe", "F"), "C9H11NO2"),
+    ("Proline", ("Pro", "P"), "C5H9NO2"),
+    ("Serine", ("Ser", "S"), "C3H7NO3"),
+    ("Threonine", ("Thr", "T"), "C4H9NO3"),
+    ("Tryptophan", ("Trp", "W"), "C11H12N2O2"),
+    ("Tyrosine", ("Tyr", "Y"), "C9H11NO3"),
+    ("Valine", ("Val", "V"), "C5H11NO2"),
+    ("Selenocysteine", ("Sec", "U"), "C3H7NO2Se"),
+    ("Pyrrolysine", ("Pyl", "O"), "C12H21N3O3"),
+)
+
+_NUCLEOTIDES: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("Adenine", ("Ade",), "C5H5N5"),
+    ("Guanine", ("Gua",), "C5H5N5O"),
+    ("Cytosine", ("Cyt",), "C4H5N3O"),
+    ("Thymine", ("Thy",), "C5H6N2O2"),
+    ("Uracil", ("Ura",), "C4H4N2O2"),
+    ("Adenosine", (), "C10H13N5O4"),
+    ("Guanosine", (), "C10H13N5O5"),
+    ("Cytidine", (), "C9H13N3O5"),
+    ("Uridine", (), "C9H12N2O6"),
+    ("Thymidine", (), "C10H14N2O5"),
+    ("Adenosine monophosphate", ("AMP",), "C10H14N5O7P"),
+    ("Adenosine diphosphate", ("ADP",), "C10H15N5O10P2"),
+    ("Adenosine triphosphate", ("ATP",), "C10H16N5O13P3"),
+    ("Cyclic adenosine monophosphate", ("cAMP",), "C10H12N5O6P"),
+    ("Guanosine monophosphate", ("GMP",), "C10H14N5O8P"),
+    ("Guanosine diphosphate", ("GDP",), "C10H15N5O11P2"),
+    ("Guanosine triphosphate", ("GTP",), "C10H16N5O14P3"),
+    ("Cytidine monophosphate", ("CMP",), "C9H14N3O8P"),
+    ("Cytidine triphosphate", ("CTP",), "C9H16N3O14P3"),
+    ("Uridine monophosphate", ("UMP",), "C9H13N2O9P"),
+    ("Uridine triphosphate", ("UTP",), "C9H15N2O15P3"),
+    ("Deoxyadenosine triphosphate", ("dATP",), "C10H16N5O12P3"),
+    ("Deoxyguanosine triphosphate", ("dGTP",), "C10H16N5O13P3"),
+    ("Deoxycytidine triphosphate", ("dCTP",), "C9H16N3O13P3"),
+    ("Deoxythymidine triphosphate", ("dTTP",), "C10H17N2O14P3"),
+)
+
+_METABOLITES: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("Water", (), "H2O"),
+    ("Carbon dioxide", (), "CO2"),
+    ("Oxygen", (), "O2"),
+    ("Ammonia", (), "NH3"),
+    ("Urea", (), "CH4N2O"),
+    ("Phosphate", ("Pi",), "H3PO4"),
+    ("Pyrophosphate", ("PPi",), "H4P2O7"),
+    ("Glucose", (), "C6H12O6"),
+    ("Fructose", (), "C6H12O6"),
+    ("Galactose", (), "C6H12O6"),
+    ("Sucrose", (), "C12H22O11"),
+    ("Lactose", (), "C12H22O11"),
+    ("Glucose 6-phosphate", ("G6P",), "C6H13O9P"),
+    ("Fructose 6-phosphate", ("F6P",), "C6H13O9P"),
+    ("Fructose 1,6-bisphosphate", ("F1,6BP",), "C6H14O12P2"),
+    ("Dihydroxyacetone phosphate", ("DHAP",), "C3H7O6P"),
+    ("Glyceraldehyde 3-phosphate", ("GAP", "G3P"), "C3H7O6P"),
+    ("1,3-Bisphosphoglycerate", ("1,3-BPG",), "C3H8O10P2"),
+    ("3-Phosphoglycerate", ("3PG",), "C3H7O7P"),
+    ("2-Phosphoglycerate", ("2PG",), "C3H7O7P"),
+    ("Phosphoenolpyruvate", ("PEP",), "C3H5O6P"),
+    ("Pyruvate", ("Pyruvic acid",), "C3H4O3"),
+    ("Lactate", ("Lactic acid",), "C3H6O3"),
+    ("Ethanol", (), "C2H6O"),
+    ("Acetaldehyde", (), "C2H4O"),
+    ("Ribose 5-phosphate", ("R5P",), "C5H11O8P"),
+    ("Ribulose 5-phosphate", ("Ru5P",), "C5H11O8P"),
+    ("Acetyl-CoA", ("Acetyl coenzyme A",), "C23H38N7O17P3S"),
+    ("Citrate", ("Citric acid",), "C6H8O7"),
+    ("cis-Aconitate", (), "C6H6O6"),
+    ("Isocitrate", (), "C6H8O7"),
+    ("α-Ketoglutarate", ("alpha-Ketoglutarate", "2-Oxoglutarate"), "C5H6O5"),  # noqa: RUF001
+    ("Succinyl-CoA", (), "C25H40N7O19P3S"),
+    ("Succinate", ("Succinic acid",), "C4H6O4"),
+    ("Fumarate", ("Fumaric acid",), "C4H4O4"),
+    ("Malate", ("Malic acid",), "C4H6O5"),
+    ("Oxaloacetate", ("OAA",), "C4H4O5"),
+    ("Nicotinamide adenine dinucleotide", ("NAD+",), "C21H27N7O14P2"),
+    ("Reduced nicotinamide adenine dinucleotide", ("NADH",), "C21H29N7O14P2"),
+    ("Nicotinamide adenine dinucleotide phosphate", ("NADP+",), "C21H28N7O17P3"),
+    ("Reduced nicotinamide adenine dinucleotide phosphate", ("NADPH",), "C21H30N7O17P3"),
+    ("Flavin adenine dinucleotide", ("FAD",), "C27H33N9O15P2"),
+    ("Reduced flavin adenine dinucleotide", ("FADH2",), "C27H35N9O15P2"),
+    ("Coenzyme A", ("CoA",), "C21H36N7O16P3S"),
+    ("S-Adenosylmethionine", ("SAM",), "C15H22N6O5S"),
+    ("Glutathione", ("GSH",), "C10H17N3O6S"),
+    ("Creatine", (), "C4H9N3O2"),
+    ("Phosphocreatine", (), "C4H10N3O5P"),
+    ("Carbamoyl phosphate", (), "CH4NO5P"),
+    ("Ornithine", (), "C5H12N2O2"),
+    ("Citrulline", (), "C6H13N3O3"),
+    ("Glycerol", (), "C3H8O3"),
+    ("Palmitic acid", ("Palmitate",), "C16H32O2"),
+    ("Acetoacetate", ("Acetoacetic acid",), "C4H6O3"),
+    ("β-Hydroxybutyrate", ("beta-Hydroxybutyrate",), "C4H8O3"),
+    ("Cholesterol", (), "C27H46O"),
+    ("Heme b", ("Haem b",), "C34H32FeN4O4"),
+)
+
+_ENZYMES: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("Hexokinase", (), "2.7.1.1"),
+    ("Glucokinase", (), "2.7.1.2"),
+    ("Glucose-6-phosphate isomerase", ("PGI",), "5.3.1.9"),
+    ("Phosphofructokinase", ("PFK",), "2.7.1.11"),
+    ("Fructose-bisphosphate aldolase", ("Aldolase",), "4.1.2.13"),
+    ("Triosephosphate isomerase", ("TIM", "TPI"), "5.3.1.1"),
+    ("Glyceraldehyde-3-phosphate dehydrogenase", ("GAPDH",), "1.2.1.12"),
+    ("Phosphoglycerate kinase", ("PGK",), "2.7.2.3"),
+    ("Phosphoglycerate mutase", ("PGM",), "5.4.2.11"),
+    ("Enolase", (), "4.2.1.11"),
+    ("Pyruvate kinase", ("PK",), "2.7.1.40"),
+    ("Lactate dehydrogenase", ("LDH",), "1.1.1.27"),
+    ("Pyruvate decarboxylase", (), "4.1.1.1"),
+    ("Alcohol dehydrogenase", ("ADH",), "1.1.1.1"),
+    ("Pyruvate dehydrogenase", ("PDH",), "1.2.4.1"),
+    ("Citrate synthase", (), "2.3.3.1"),
+    ("Aconitase", (), "4.2.1.3"),
+    ("Isocitrate dehydrogenase", ("IDH",), "1.1.1.41"),
+    ("α-Ketoglutarate dehydrogenase", ("alpha-Ketoglutarate dehydrogenase",), "1.2.4.2"),  # noqa: RUF001
+    ("Succinyl-CoA synthetase", (), "6.2.1.5"),
+    ("Succinate dehydrogenase", ("SDH",), "1.3.5.1"),
+    ("Fumarase", (), "4.2.1.2"),
+    ("Malate dehydrogenase", ("MDH",), "1.1.1.37"),
+    ("Pyruvate carboxylase", (), "6.4.1.1"),
+    ("Phosphoenolpyruvate carboxykinase", ("PEPCK",), "4.1.1.32"),
+    ("Fructose-1,6-bisphosphatase", ("FBPase",), "3.1.3.11"),
+    ("Glucose-6-phosphatase", (), "3.1.3.9"),
+    ("Glucose-6-phosphate dehydrogenase", ("G6PD",), "1.1.1.49"),
+    ("Glycogen phosphorylase", (), "2.4.1.1"),
+    ("Glycogen synthase", (), "2.4.1.11"),
+    ("Adenylate kinase", (), "2.7.4.3"),
+    ("Creatine kinase", ("CK",), "2.7.3.2"),
+    ("ATP synthase", (), "7.1.2.2"),
+    ("Cytochrome c oxidase", ("Complex IV",), "7.1.1.9"),
+    ("Acetyl-CoA carboxylase", ("ACC",), "6.4.1.2"),
+    ("Fatty acid synthase", ("FAS",), "2.3.1.85"),
+    ("HMG-CoA reductase", (), "1.1.1.34"),
+    ("Carbamoyl phosphate synthetase I", ("CPS1",), "6.3.4.16"),
+    ("Arginase", (), "3.5.3.1"),
+    ("Glutamine synthetase", (), "6.3.1.2"),
+    ("Alanine transaminase", ("ALT",), "2.6.1.2"),
+    ("Aspartate transaminase", ("AST",), "2.6.1.1"),
+    ("Urease", (), "3.5.1.5"),
+    ("Carbonic anhydrase", (), "4.2.1.1"),
+    ("Catalase", (), "1.11.1.6"),
+    ("Superoxide dismutase", ("SOD",), "1.15.1.1"),
+    ("Acetylcholinesterase", ("AChE",), "3.1.1.7"),
+    ("Trypsin", (), "3.4.21.4"),
+    ("Chymotrypsin", (), "3.4.21.1"),
+    ("Pepsin", (), "3.4.23.1"),
+    ("Thrombin", (), "3.4.21.5"),
+    ("Lysozyme", (), "3.2.1.17"),
+    ("α-Amylase", ("alpha-Amylase",), "3.2.1.1"),  # noqa: RUF001
+    ("β-Galactosidase", ("beta-Galactosidase",), "3.2.1.23"),
+    ("Triacylglycerol lipase", ("Lipase",), "3.1.1.3"),
+    ("Ribonuclease A", ("RNase A",), "4.6.1.18"),
+    ("DNA polymerase", (), "2.7.7.7"),
+    ("RNA polymerase", (), "2.7.7.6"),
+    ("Reverse transcriptase", (), "2.7.7.49"),
+    ("DNA ligase", (), "6.5.1.1"),
+    ("Ribulose-1,5-bisphosphate carboxylase/oxygenase", ("RuBisCO",), "4.1.1.39"),
+    ("Nitrogenase", (), "1.18.6.1"),
+    ("Firefly luciferase", ("Luciferase",), "1.13.12.7"),
+)
+
+
+def _normalize(text: str) -> str:
+    return text.strip().casefold()
+
+
+class TermIndex:
+    """Prefix index over terms, backed by sorted key arrays searched with :mod:`bisect`.
+
+    Every name and abbreviation is indexed, as well as the remainder of the name from the
+    start of each word, so "phosphate" also suggests "Glucose 6-phosphate". Each category
+    has its own arrays, so restricting a search to a category never scans other terms.
+    """
+
+    def __init__(self, terms: Iterable[Term]) -> None:
+        self.terms: tuple[Term, ...] = tuple(sorted(terms, key=lambda term: _normalize(term.name)))
+        self._by_name: dict[str, Term] = {}
+        self._keys: dict[TermCategory, list[str]] = {}
+        self._ids: dict[TermCategory, list[int]] = {}
+
+        entries: dict[TermCategory, set[tuple[str, int]]] = {
+            category: set() for category in TermCategory
+        }
+        for term_id, term in enumerate(self.terms):
+            for text in (term.name, *term.aliases):
+                key = _normalize(text)
+                self._by_name.setdefault(key, term)
+                entries[term.category].add((key, term_id))
+                entries[term.category].update(
+                    (key[match.start() :], term_id) for match in _WORD_START.finditer(key)
+                )
+
+        for category, pairs in entries.items():
+            ordered = sorted(pairs)
+            self._keys[category] = [key for key, _term_id in ordered]
+            self._ids[category] = [term_id for _key, term_id in ordered]
+
+    def get(self, name: str) -> Term | None:
+        """Find a term by its exact name or abbreviation, ignoring case.
+
+        Parameters
+        ----------
+        name : str
+            The name or abbreviation to look up.
+
+        Returns
+        -------
+        Term | None
+            The matching term, or None if there is none.
+        """
+        return self._by_name.get(_normalize(name))
+
+    def search(
+        self,
+        prefix: str,
+        categories: Iterable[TermCategory] | None = None,
+        limit: int = MAX_CHOICES,
+    ) -> list[Term]:
+        """Find the terms with a name, abbreviation or word starting with a prefix.
+
+        Parameters
+        ----------
+        prefix : str
+            What the user typed so far, case is ignored.
+        categories : Iterable[TermCategory] | None
+            Only suggest terms in these categories, all categories by default.
+        limit : int
+            Maximum amount of terms to return.
+
+        Returns
+        -------
+        list[Term]
+            The matching terms, in order of the matched key.
+        """
+        prefix = _normalize(prefix)
+        selected = tuple(TermCategory) if categories is None else tuple(categories)
+
+        if not prefix:
+            return list(
+                itertools.islice((term for term in self.terms if term.category in selected), limit)
+            )
+
+        matches = heapq.merge(*(self._matches(category, prefix) for category in selected))
+
+        seen: set[int] = set()
+        found: list[Term] = []
+        for _key, term_id in matches:
+            if term_id in seen:
+                continue
+
+            seen.add(term_id)
+            found.append(self.terms[term_id])
+            if len(found) >= limit:
+                break
+
+        return found
+
+    def choices(
+        self, current: str, categories: Iterable[TermCategory] | None = None
+    ) -> list[app_commands.Choice[str]]:
+        """Autocomplete choices for what the user typed so far.
+
+        Parameters
+        ----------
+        current : str
+            The current value of the option being completed.
+        categories : Iterable[TermCategory] | None
+            Only suggest terms in these categories, all categories by default.
+
+        Returns
+        -------
+        list[app_commands.Choice[str]]
+            At most 25 choices, named after the term label with the term name as value.
+        """
+        return [
+            app_commands.Choice(name=term.label, value=term.name)
+            for term in self.search(current, categories)
+        ]
+
+    def _matches(self, category: TermCategory, prefix: str) -> Iterator[tuple[str, int]]:
+        keys = self._keys[category]
+        ids = self._ids[category]
+
+        index = bisect.bisect_left(keys, prefix)
+        while index < len(keys) and keys[index].startswith(prefix):
+            yield keys[index], ids[index]
+            index += 1
+
+
+def extension_names() -> list[str]:
+    """Names of the modules in :mod:`biochemie_bot.cogs`.
+
+    Returns
+    -------
+    list[str]
+        The module names, without the package prefix.
+    """
+    return [module.name for module in pkgutil.iter_modules(biochemie_bot.cogs.__path__)]
+
+
+@functools.cache
+def default_index() -> TermIndex:
+    """Build the index of all built-in terms and extensions, only once.
+
+    Returns
+    -------
+    TermIndex
+        The shared index.
+    """
+    tables = (
+        (TermCategory.AMINO_ACID, _AMINO_ACIDS),
+        (TermCategory.NUCLEOTIDE, _NUCLEOTIDES),
+        (TermCategory.METABOLITE, _METABOLITES),
+        (TermCategory.ENZYME, _ENZYMES),
+    )
+    terms = [
+        Term(name, category, aliases, detail)
+        for category, table in tables
+        for name, aliases, detail in table
+    ]
+    terms.extend(
+        Term(name, TermCategory.EXTENSION, (), f"biochemie_bot.cogs.{name}")
+        for name in extension_names()
+    )
+
+    return TermIndex(terms)
+
+
+def term_autocomplete(*categories: TermCategory) -> AutocompleteCallback:
+    """Create an autocomplete callback suggesting terms, for use with `app_commands.autocomplete`.
+
+    Parameters
+    ----------
+    *categories : TermCategory
+        Only suggest terms in these categories, all categories if none are given.
+
+    Returns
+    -------
+    AutocompleteCallback
+        The callback to pass to the decorator.
+    """
+    selected = categories or None
+
+    async def callback(  # noqa: RUF029
+        _interaction: discord.Interaction[Any], current: str
+    ) -> list[app_commands.Choice[str]]:
+        return default_index().choices(current, selected)
+
+    return callback
@@ -1,3 +1,4 @@
+from discord import app_commands
 from discord.ext import commands
 
 
@@ -6,3 +7,7 @@ class ButtonOnCooldown(commands.CommandError):
 
     def __init__(self, time_left: float) -> None:
         self.time_left = time_left
+
+
+class BotDraining(app_commands.CheckFailure):
+    """Raise when an interaction arrives while the bot is draining for shutdown."""
@@ -0,0 +1,241 @@
+import csv
+import functools
+import re
+import string
+from collections.abc import Iterable
+from typing import NamedTuple, TextIO
+
+MAX_FORMULA_LENGTH = 200
+CACHE_SIZE = 8192
+
+# Conventional standard atomic weights (IUPAC 2021), the mass number of the most stable isotope
+# for elements without a standard atomic weight.
+_ATOMIC_WEIGHTS = """
+H 1.008 He 4.0026 Li 6.94 Be 9.0122 B 10.81 C 12.011 N 14.007 O 15.999 F 18.998 Ne 20.180
+Na 22.990 Mg 24.305 Al 26.982 Si 28.085 P 30.974 S 32.06 Cl 35.45 Ar 39.95 K 39.098 Ca 40.078
+Sc 44.956 Ti 47.867 V 50.942 Cr 51.996 Mn 54.938 Fe 55.845 Co 58.933 Ni 58.693 Cu 63.546
+Zn 65.38 Ga 69.723 Ge 72.630 As 74.922 Se 78.971 Br 79.904 Kr 83.798 Rb 85.468 Sr 87.62
+Y 88.906 Zr 91.224 Nb 92.906 Mo 95.95 Tc 97 Ru 101.07 Rh 102.91 Pd 106.42 Ag 107.87 Cd 112.41
+In 114.82 Sn 118.71 Sb 121.76 Te 127.60 I 126.90 Xe 131.29 Cs 132.91 Ba 137.33 La 138.91
+Ce 140.12 Pr 140.91 Nd 144.24 Pm 145 Sm 150.36 Eu 151.96 Gd 157.25 Tb 158.93 Dy 162.50
+Ho 164.93 Er 167.26 Tm 168.93 Yb 173.05 Lu 174.97 Hf 178.49 Ta 180.95 W 183.84 Re 186.21
+Os 190.23 Ir 192.22 Pt 195.08 Au 196.97 Hg 200.59 Tl 204.38 Pb 207.2 Bi 208.98 Po 209 At 210
+Rn 222 Fr 223 Ra 226 Ac 227 Th 232.04 Pa 231.04 U 238.03 Np 237 Pu 244 Am 243 Cm 247 Bk 247
+Cf 251 Es 252 Fm 257 Md 258 No 259 Lr 266 Rf 267 Db 268 Sg 269 Bh 270 Hs 269 Mt 278 Ds 281
+Rg 282 Cn 285 Nh 286 Fl 289 Mc 290 Lv 293 Ts 294 Og 294
+"""
+
+_TOKENS = _ATOMIC_WEIGHTS.split()
+ATOMIC_WEIGHTS: dict[str, float] = {
+    symbol: float(weight) for symbol, weight in zip(_TOKENS[::2], _TOKENS[1::2], strict=True)
+}
+
+_OPEN_TO_CLOSE = {"(": ")", "[": "]", "{": "}"}
+
+# An element with its count, an opening bracket, a closing bracket with its count, or anything
+# else, which is always an error.
+_TOKEN = re.compile(r"([A-Z][a-z]?)(\d*)|([(\[{])|([)\]}])(\d*)|(.)")
+_HYDRATE_SEPARATOR = re.compile(r"\s*[·•*.]\s*")
+
+CSV_HEADER = ("input", "formula", "molar_mass", "composition", "error")
+
+
+class Formula(NamedTuple):
+    """A parsed molecular formula."""
+
+    counts: tuple[tuple[str, int], ...]
+    molar_mass: float
+
+    @property
+    def hill(self) -> str:
+        """The formula in Hill notation."""
+        return "".join(
+            f"{symbol}{count}" if count > 1 else symbol for symbol, count in self.counts
+        )
+
+    @property
+    def atoms(self) -> int:
+        """The total amount of atoms."""
+        return sum(count for _symbol, count in self.counts)
+
+    def mass_fractions(self) -> list[tuple[str, float]]:
+        """Contribution of each element to the molar mass.
+
+        Returns
+        -------
+        list[tuple[str, float]]
+            The element symbol and its mass fraction, in Hill order.
+        """
+        return [
+            (symbol, count * ATOMIC_WEIGHTS[symbol] / self.molar_mass)
+            for symbol, count in self.counts
+        ]
+
+
+def _hill_key(symbol: str, *, has_carbon: bool) -> tuple[int, str]:
+    if has_carbon and symbol in {"C", "H"}:
+        return (0, symbol)
+
+    return (1, symbol)
+
+
+def _parse_part(part: str, text: str) -> dict[str, int]:
+    # Parse one part of a hydrate, without its leading coefficient. Every stack level holds
+    # the opening bracket and the counts inside it, the outer level has no bracket.
+    stack: list[tuple[str, dict[str, int]]] = [("", {})]
+
+    for match in _TOKEN.finditer(part):
+        symbol, count, opening, closing, group_count, other = match.groups()
+
+        if symbol is not None:
+            if symbol not in ATOMIC_WEIGHTS:
+                msg = f"Unknown element `{symbol}` in `{text}`."
+                raise ValueError(msg)
+
+            counts = stack[-1][1]
+            counts[symbol] = counts.get(symbol, 0) + (int(count) if count else 1)
+        elif opening is not None:
+            stack.append((opening, {}))
+        elif closing is not None:
+            if len(stack) == 1 or _OPEN_TO_CLOSE[stack[-1][0]] != closing:
+                msg = f"Unbalanced `{closing}` in `{text}`."
+                raise ValueError(msg)
+
+            _opening, group = stack.pop()
+            if not group:
+                msg = f"Empty group in `{text}`."
+                raise ValueError(msg)
+
+            multiplier = int(group_count) if group_count else 1
+            counts = stack[-1][1]
+            for element, amount in group.items():
+                counts[element] = counts.get(element, 0) + amount * multiplier
+        else:
+            msg = f"Unexpected `{other}` in `{text}`."
+            raise ValueError(msg)
+
+    if len(stack) > 1:
+        msg = f"Unclosed `{stack[-1][0]}` in `{text}`."
+        raise ValueError(msg)
+
+    return stack[0][1]
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _parse_formula(text: str) -> Formula:
+    if not text:
+        msg = "Empty formula."
+        raise ValueError(msg)
+
+    if len(text) > MAX_FORMULA_LENGTH:
+        msg = f"Formulas can be at most {MAX_FORMULA_LENGTH} characters long."
+        raise ValueError(msg)
+
+    totals: dict[str, int] = {}
+    for part in _HYDRATE_SEPARATOR.split(text):
+        coefficient = len(part) - len(part.lstrip(string.digits))
+        multiplier = int(part[:coefficient]) if coefficient else 1
+
+        counts = _parse_part(part[coefficient:].lstrip(), text)
+        if not counts:
+            msg = f"Missing formula in `{text}`."
+            raise ValueError(msg)
+
+        for symbol, count in counts.items():
+            totals[symbol] = totals.get(symbol, 0) + count * multiplier
+
+    has_carbon = "C" in totals
+    ordered = tuple(
+        sorted(
+            ((symbol, count) for symbol, count in totals.items() if count),
+            key=lambda item: _hill_key(item[0], has_carbon=has_carbon),
+        )
+    )
+    if not ordered:
+        msg = f"`{text}` contains no atoms."
+        raise ValueError(msg)
+
+    return Formula(ordered, sum(ATOMIC_WEIGHTS[symbol] * count for symbol, count in ordered))
+
+
+def parse_formula(text: str) -> Formula:
+    """Parse a molecular formula, results are cached.
+
+    Nested groups using (), [] or {} are supported, as are hydrates and adducts separated by
+    a middle dot, bullet, asterisk or period, each with an optional leading coefficient,
+    e.g. `Ca(OH)2`, `K4[Fe(CN)6]` or `CuSO4·5H2O`. Raises :class:`ValueError` when the
+    formula is empty, too long, unbalanced or contains an unknown element.
+
+    Parameters
+    ----------
+    text : str
+        The formula to parse.
+
+    Returns
+    -------
+    Formula
+        The element counts in Hill order and the molar mass.
+    """
+    return _parse_formula(text.strip())
+
+
+def format_composition(formula: Formula) -> str:
+    """Format the mass fractions of a formula as `C 40.00%; H 6.71%; ...`.
+
+    Parameters
+    ----------
+    formula : Formula
+        The parsed formula.
+
+    Returns
+    -------
+    str
+        The formatted composition.
+    """
+    return "; ".join(f"{symbol} {fraction:.2%}" for symbol, fraction in formula.mass_fractions())
+
+
+def write_csv(lines: Iterable[str], out: TextIO) -> tuple[int, int]:
+    """Parse formulas one by one and write a CSV row for each as soon as it is parsed.
+
+    Blank lines and lines starting with `#` are skipped. Formulas which fail to parse get a
+    row with the error message instead of aborting the batch.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The formulas, one per line.
+    out : TextIO
+        Where to write the CSV to.
+
+    Returns
+    -------
+    tuple[int, int]
+        The amount of parsed formulas and the amount of errors.
+    """
+    writer = csv.writer(out)
+    writer.writerow(CSV_HEADER)
+
+    parsed = errors = 0
+    for line in lines:
+        text = line.strip()
+        if not text or text.startswith("#"):
+            continue
+
+        try:
+            formula = parse_formula(text)
+        except ValueError as error:
+            writer.writerow((text, "", "", "", str(error)))
+            errors += 1
+            continue
+
+        writer.writerow((
+            text,
+            formula.hill,
+            f"{formula.molar_mass:.4f}",
+            format_composition(formula),
+            "",
+        ))
+        parsed += 1
+
+    return parsed, errors
@@ -0,0 +1,520 @@
+import hashlib
+import io
+import math
+from enum import Enum
+from typing import NamedTuple, Self
+
+import numpy as np
+import numpy.typing as npt
+
+from biochemie_bot.utils.plotting import figure_to_png, new_figure
+
+type FloatArray = npt.NDArray[np.float64]
+
+MAX_ROWS = 10_000
+GRID_POINTS = 16
+STARTS = 8
+# Candidates times measurements evaluated at once while searching the start grid.
+GRID_CHUNK_CELLS = 2**18
+MAX_ITERATIONS = 200
+TOLERANCE = 1e-10
+
+# Two-sided 95% quantiles of Student's t-distribution for 1 to 30 degrees of freedom.
+_T_QUANTILES = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)  # fmt: skip
+_Z_975 = 1.959964
+
+
+class KineticsModel(Enum):
+    """Rate equations that can be fitted, all share the form ``v = Vmax·S / (Km·a + S·b)``."""
+
+    MICHAELIS_MENTEN = "Michaelis-Menten"
+    COMPETITIVE = "competitive"
+    UNCOMPETITIVE = "uncompetitive"
+    MIXED = "mixed"
+
+    @property
+    def parameters(self) -> tuple[str, ...]:
+        """Names of the fitted parameters."""
+        match self:
+            case KineticsModel.MICHAELIS_MENTEN:
+                return ("Vmax", "Km")
+            case KineticsModel.COMPETITIVE:
+                return ("Vmax", "Km", "Ki")
+            case KineticsModel.UNCOMPETITIVE:
+                return ("Vmax", "Km", "Ki'")
+            case KineticsModel.MIXED:
+                return ("Vmax", "Km", "Ki", "Ki'")
+
+    @property
+    def needs_inhibitor(self) -> bool:
+        """Whether the model can only be fitted to data with inhibitor concentrations."""
+        return self is not KineticsModel.MICHAELIS_MENTEN
+
+
+class KineticsData(NamedTuple):
+    """Measured rates, the inhibitor concentration is 0 when not given."""
+
+    substrate: FloatArray
+    rate: FloatArray
+    inhibitor: FloatArray
+    digest: str
+
+    @property
+    def has_inhibitor(self) -> bool:
+        """Whether any measurement was done with an inhibitor present."""
+        return bool((self.inhibitor > 0).any())
+
+    def measured(self) -> Self:
+        """Leave out blanks, rows without substrate carry no information about the parameters.
+
+        Returns
+        -------
+        KineticsData
+            The measurements with a positive substrate concentration.
+        """
+        selected = self.substrate > 0
+        return self._replace(
+            substrate=self.substrate[selected],
+            rate=self.rate[selected],
+            inhibitor=self.inhibitor[selected],
+        )
+
+
+class Parameter(NamedTuple):
+    """A fitted parameter with its standard error and 95% confidence interval."""
+
+    name: str
+    value: float
+    standard_error: float
+    lower: float
+    upper: float
+
+
+class KineticsFit(NamedTuple):
+    """Result of fitting a model to measured rates."""
+
+    model: KineticsModel
+    parameters: list[Parameter]
+    sum_of_squares: float
+    r_squared: float
+    aic: float
+    observations: int
+
+
+class CsvParser:
+    """Incremental parser for kinetics CSV files, fed one line at a time.
+
+    Every row holds the substrate concentration, the rate and optionally the inhibitor
+    concentration. Comma, semicolon and tab separators are supported, with semicolon separated
+    files allowed to use decimal commas. Non-numeric rows, like headers, are skipped. The SHA-256
+    digest of the raw content is computed along the way.
+    """
+
+    def __init__(self) -> None:
+        self._hash = hashlib.sha256()
+        self._rows: list[tuple[float, float, float]] = []
+
+    def feed(self, line: bytes) -> None:
+        """Parse a single line.
+
+        Parameters
+        ----------
+        line : bytes
+            The raw line, including its line ending.
+
+        Raises
+        ------
+        ValueError
+            The file contains too many rows.
+        """
+        self._hash.update(line)
+
+        text = line.decode(errors="replace").strip()
+        if not text:
+            return
+
+        if ";" in text:
+            fields = text.replace(",", ".").split(";")
+        elif "\t" in text:
+            fields = text.split("\t")
+        else:
+            fields = text.split(",")
+
+        try:
+            values = [float(field) for field in fields if field.strip()]
+        except ValueError:
+            return
+
+        if len(values) < 2 or not all(math.isfinite(value) for value in values):  # noqa: PLR2004
+            return
+
+        if len(self._rows) >= MAX_ROWS:
+            msg = f"The file can contain at most {MAX_ROWS} rows."
+            raise ValueError(msg)
+
+        self._rows.append((values[0], values[1], values[2] if len(values) > 2 else 0.0))  # noqa: PLR2004
+
+    def result(self) -> KineticsData:
+        """Get the parsed data.
+
+        Returns
+        -------
+        KineticsData
+            All parsed measurements.
+        """
+        rows = np.array(self._rows, dtype=np.float64).reshape(-1, 3)
+        return KineticsData(
+            substrate=rows[:, 0],
+            rate=rows[:, 1],
+            inhibitor=rows[:, 2],
+            digest=self._hash.hexdigest(),
+        )
+
+
+def parse_csv(content: bytes) -> KineticsData:
+    """Parse a whole kinetics CSV file at once, see :class:`CsvParser`.
+
+    Parameters
+    ----------
+    content : bytes
+        The file content.
+
+    Returns
+    -------
+    KineticsData
+        All parsed measurements.
+    """
+    parser = CsvParser()
+    for line in io.BytesIO(content):
+        parser.feed(line)
+    return parser.result()
+
+
+def rate_equation(
+    model: KineticsModel, parameters: FloatArray, substrate: FloatArray, inhibitor: FloatArray
+) -> tuple[FloatArray, FloatArray]:
+    """Evaluate a rate equation and its Jacobian for a batch of parameter sets.
+
+    Parameters
+    ----------
+    model : KineticsModel
+        The rate equation.
+    parameters : FloatArray
+        Parameter sets of shape ``(batch, len(model.parameters))``.
+    substrate : FloatArray
+        Substrate concentrations of shape ``(n,)``.
+    inhibitor : FloatArray
+        Inhibitor concentrations of shape ``(n,)``.
+
+    Returns
+    -------
+    tuple[FloatArray, FloatArray]
+        Rates of shape ``(batch, n)`` and their derivatives of shape
+        ``(batch, n, len(model.parameters))``.
+    """
+    vmax, km = parameters[:, 0:1], parameters[:, 1:2]
+    ki, kiu, competitive, uncompetitive = _inhibition(model, parameters, inhibitor)
+
+    denominator = km * competitive + substrate * uncompetitive
+    rate = vmax * substrate / denominator
+
+    derivatives = [substrate / denominator, -rate * competitive / denominator]
+    if ki is not None:
+        derivatives.append(rate * km * inhibitor / (ki**2 * denominator))
+    if kiu is not None:
+        derivatives.append(rate * substrate * inhibitor / (kiu**2 * denominator))
+
+    return rate, np.stack(derivatives, axis=-1)
+
+
+def _inhibition(
+    model: KineticsModel, parameters: FloatArray, inhibitor: FloatArray
+) -> tuple[FloatArray | None, FloatArray | None, FloatArray, FloatArray]:
+    # The inhibition constants of the model, if any, and the factors by which the inhibitor
+    # scales Km and [S] in the denominator.
+    ones = np.ones_like(parameters[:, 0:1])
+    ki = parameters[:, 2:3] if model in {KineticsModel.COMPETITIVE, KineticsModel.MIXED} else None
+    kiu = (
+        parameters[:, -1:] if model in {KineticsModel.UNCOMPETITIVE, KineticsModel.MIXED} else None
+    )
+
+    competitive = 1 + inhibitor / ki if ki is not None else ones
+    uncompetitive = 1 + inhibitor / kiu if kiu is not None else ones
+    return ki, kiu, competitive, uncompetitive
+
+
+def _rate(
+    model: KineticsModel, parameters: FloatArray, substrate: FloatArray, inhibitor: FloatArray
+) -> FloatArray:
+    # The rates of rate_equation, without the Jacobian.
+    _ki, _kiu, competitive, uncompetitive = _inhibition(model, parameters, inhibitor)
+    return (
+        parameters[:, 0:1]
+        * substrate
+        / (parameters[:, 1:2] * competitive + substrate * uncompetitive)
+    )
+
+
+def fit(data: KineticsData, model: KineticsModel) -> KineticsFit:
+    """Fit a rate equation to measured rates with least squares.
+
+    The whole start grid is evaluated at once, with Vmax solved in closed form since the rate is
+    linear in it. The best starts are then refined together with a batched Levenberg-Marquardt
+    solver working on the logarithm of the parameters, which keeps them positive. Blanks,
+    measurements without substrate, are left out of the fit.
+
+    Parameters
+    ----------
+    data : KineticsData
+        The measured rates.
+    model : KineticsModel
+        The rate equation to fit.
+
+    Returns
+    -------
+    KineticsFit
+        The best fit, with confidence intervals from the asymptotic covariance matrix.
+
+    Raises
+    ------
+    ValueError
+        There is too little data for the model or a concentration is negative.
+    """
+    if (data.substrate < 0).any() or (data.inhibitor < 0).any():
+        msg = "Concentrations can not be negative."
+        raise ValueError(msg)
+
+    data = data.measured()
+    parameter_count = len(model.parameters)
+    if data.substrate.size <= parameter_count:
+        msg = f"The {model.value} model needs more than {parameter_count} measurements."
+        raise ValueError(msg)
+    if model.needs_inhibitor and not data.has_inhibitor:
+        msg = f"The {model.value} model needs measurements with an inhibitor present."
+        raise ValueError(msg)
+
+    starts = _start_grid(data, model)
+    best = np.exp(_levenberg_marquardt(data, model, np.log(starts)))
+
+    rate, jacobian = rate_equation(model, best[None, :], data.substrate, data.inhibitor)
+    residuals = data.rate - rate[0]
+    sum_of_squares = float(residuals @ residuals)
+    degrees_of_freedom = data.substrate.size - parameter_count
+
+    covariance = sum_of_squares / degrees_of_freedom * np.linalg.pinv(jacobian[0].T @ jacobian[0])
+    errors = np.sqrt(np.clip(np.diag(covariance), 0, None))
+    quantile = t_quantile(degrees_of_freedom)
+
+    total = float(((data.rate - data.rate.mean()) ** 2).sum())
+    n = data.substrate.size
+
+    return KineticsFit(
+        model=model,
+        parameters=[
+            Parameter(
+                name,
+                float(value),
+                float(error),
+                value - quantile * error,
+                value + quantile * error,
+            )
+            for name, value, error in zip(model.parameters, best, errors, strict=True)
+        ],
+        sum_of_squares=sum_of_squares,
+        r_squared=1 - sum_of_squares / total if total else 1.0,
+        aic=n * math.log(max(sum_of_squares, 1e-300) / n) + 2 * parameter_count,
+        observations=n,
+    )
+
+
+def fit_best(data: KineticsData) -> KineticsFit:
+    """Fit every applicable model and return the one with the lowest AIC.
+
+    Parameters
+    ----------
+    data : KineticsData
+        The measured rates.
+
+    Returns
+    -------
+    KineticsFit
+        The best fitting model.
+
+    Raises
+    ------
+    ValueError
+        There is too little data for any model.
+    """
+    measured = data.measured()
+    models = [
+        model
+        for model in KineticsModel
+        if len(model.parameters) < measured.substrate.size
+        and (measured.has_inhibitor or not model.needs_inhibitor)
+    ]
+    if not models:
+        msg = "At least 3 measurements are needed to fit a model."
+        raise ValueError(msg)
+
+    return min((fit(data, model) for model in models), key=lambda result: result.aic)
+
+
+def t_quantile(degrees_of_freedom: int) -> float:
+    """Two-sided 95% quantile of Student's t-distribution.
+
+    Parameters
+    ----------
+    degrees_of_freedom : int
+        Degrees of freedom, at least 1.
+
+    Returns
+    -------
+    float
+        The quantile, exact up to 30 degrees of freedom and a Cornish-Fisher expansion above.
+    """
+    if degrees_of_freedom <= len(_T_QUANTILES):
+        return _T_QUANTILES[degrees_of_freedom - 1]
+
+    z = _Z_975
+    return (
+        z
+        + (z**3 + z) / (4 * degrees_of_freedom)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * degrees_of_freedom**2)
+    )
+
+
+def _start_grid(data: KineticsData, model: KineticsModel) -> FloatArray:
+    # Log-spaced grid over the nonlinear parameters, returns the best STARTS parameter sets.
+    # The grid is evaluated in chunks, which keeps memory use proportional to the data size.
+    substrate_range = np.geomspace(
+        data.substrate.min() / 10, data.substrate.max() * 10, GRID_POINTS
+    )
+    inhibitors = data.inhibitor[data.inhibitor > 0]
+    inhibitor_range = (
+        np.geomspace(inhibitors.min() / 10, inhibitors.max() * 10, GRID_POINTS)
+        if inhibitors.size
+        else np.ones(1)
+    )
+
+    axes = [substrate_range] + [inhibitor_range] * (len(model.parameters) - 2)
+    grid = np.stack([axis.ravel() for axis in np.meshgrid(*axes, indexing="ij")], axis=-1)
+
+    candidates = np.concatenate([np.ones((grid.shape[0], 1)), grid], axis=1)
+    sum_of_squares = np.empty(grid.shape[0], dtype=np.float64)
+    chunk_size = max(1, GRID_CHUNK_CELLS // data.substrate.size)
+
+    for start in range(0, grid.shape[0], chunk_size):
+        chunk = candidates[start : start + chunk_size]
+        shape = _rate(model, chunk, data.substrate, data.inhibitor)
+        vmax = (shape @ data.rate) / np.maximum((shape**2).sum(axis=1), 1e-300)
+        chunk[:, 0] = np.maximum(vmax, 1e-12)
+        sum_of_squares[start : start + chunk_size] = ((data.rate - shape * chunk[:, :1]) ** 2).sum(
+            axis=1
+        )
+
+    return candidates[np.argsort(sum_of_squares)[:STARTS]]
+
+
+def _levenberg_marquardt(
+    data: KineticsData, model: KineticsModel, theta: FloatArray
+) -> FloatArray:
+    # Refines all starts at once, theta holds the log parameters of shape (batch, p).
+    damping = np.full(theta.shape[0], 1e-3)
+    identity = np.eye(theta.shape[1])
+
+    def evaluate(theta: FloatArray) -> tuple[FloatArray, FloatArray]:
+        parameters = np.exp(theta)
+        rate, jacobian = rate_equation(model, parameters, data.substrate, data.inhibitor)
+        return data.rate - rate, jacobian * parameters[:, None, :]
+
+    residuals, jacobian = evaluate(theta)
+    sum_of_squares = (residuals**2).sum(axis=1)
+
+    for _ in range(MAX_ITERATIONS):
+        transposed = jacobian.transpose(0, 2, 1)
+        normal = transposed @ jacobian
+        normal += damping[:, None, None] * (normal * identity + 1e-12 * identity)
+
+        step = np.linalg.solve(normal, transposed @ residuals[:, :, None])[:, :, 0]
+        candidate = np.clip(theta + step, -50, 50)
+        candidate_residuals, candidate_jacobian = evaluate(candidate)
+        candidate_sum = (candidate_residuals**2).sum(axis=1)
+
+        improved = candidate_sum < sum_of_squares
+        converged = np.abs(sum_of_squares - candidate_sum) <= TOLERANCE * (sum_of_squares + 1e-300)
+
+        theta = np.where(improved[:, None], candidate, theta)
+        residuals = np.where(improved[:, None], candidate_residuals, residuals)
+        jacobian = np.where(improved[:, None, None], candidate_jacobian, jacobian)
+        sum_of_squares = np.where(improved, candidate_sum, sum_of_squares)
+        damping = np.where(improved, damping / 3, damping * 2)
+
+        if converged.all():
+            break
+
+    return theta[np.argmin(sum_of_squares)]
+
+
+def render(data: KineticsData, result: KineticsFit) -> bytes:
+    """Plot the measured rates together with the fitted curves.
+
+    Parameters
+    ----------
+    data : KineticsData
+        The measured rates.
+    result : KineticsFit
+        The fit to draw.
+
+    Returns
+    -------
+    bytes
+        The plot as PNG.
+    """
+    figure = new_figure()
+    axes = figure.add_subplot()
+
+    parameters = np.array([[parameter.value for parameter in result.parameters]])
+    curve_substrate = np.linspace(0, data.substrate.max() * 1.1, 200)
+
+    for inhibitor in np.unique(data.inhibitor):
+        selected = data.inhibitor == inhibitor
+        label = f"[I] = {inhibitor:g}" if data.has_inhibitor else "measured"
+        points = axes.scatter(data.substrate[selected], data.rate[selected], label=label, zorder=3)
+
+        curve, _jacobian = rate_equation(
+            result.model, parameters, curve_substrate, np.full_like(curve_substrate, inhibitor)
+        )
+        axes.plot(curve_substrate, curve[0], color=points.get_facecolor()[0])
+
+    axes.set_title(f"{result.model.value} fit")
+    axes.set_xlabel("[S]")
+    axes.set_ylabel("v")
+    axes.set_xlim(left=0)
+    axes.set_ylim(bottom=0)
+    axes.grid(alpha=0.3)
+    axes.legend()
+
+    return figure_to_png(figure)
+
+
+def analyse(data: KineticsData, model: KineticsModel | None) -> tuple[KineticsFit, bytes]:
+    """Fit and plot in one go, meant to be run in an executor.
+
+    Parameters
+    ----------
+    data : KineticsData
+        The measured rates.
+    model : KineticsModel | None
+        The model to fit, or None to pick the model with the lowest AIC.
+
+    Returns
+    -------
+    tuple[KineticsFit, bytes]
+        The fit and its plot as PNG.
+    """
+    result = fit_best(data) if model is None else fit(data, model)
+    return result, render(data, result)
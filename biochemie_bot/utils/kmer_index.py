@@ -0,0 +1,515 @@
+import json
+import re
+import time
+from collections.abc import Iterator
+from enum import Enum
+from pathlib import Path
+from typing import NamedTuple, Self
+
+import numpy as np
+import numpy.typing as npt
+
+INDEX_VERSION = 1
+MAX_TABLE_SIZE = 2**26
+READ_BLOCK_SIZE = 64 * 2**20
+CHUNK_SIZE = 8 * 2**20
+VERIFY_BATCH_SIZE = 2**16
+MAX_CANDIDATES = 2_000_000
+
+RECORD_SEPARATOR = b"\n"
+
+_HEADER = re.compile(rb"^>([^\n]*)\n?", re.MULTILINE)
+_WHITESPACE = b" \t\r\n\v\f0123456789*"
+
+_IUPAC_NUCLEOTIDES: dict[str, str] = {
+    "A": "A",
+    "C": "C",
+    "G": "G",
+    "T": "TU",
+    "U": "TU",
+    "R": "AG",
+    "Y": "CTU",
+    "S": "CG",
+    "W": "ATU",
+    "K": "GTU",
+    "M": "AC",
+    "B": "CGTU",
+    "D": "AGTU",
+    "H": "ACTU",
+    "V": "ACG",
+    "N": "ACGTUN",
+}
+_AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+_IUPAC_AMINO_ACIDS: dict[str, str] = {
+    **{residue: residue for residue in _AMINO_ACIDS},
+    "B": "DNB",
+    "Z": "EQZ",
+    "J": "ILJ",
+    "X": _AMINO_ACIDS + "BZJXUO",
+}
+
+
+class IndexKind(Enum):
+    """The alphabet an index is built over."""
+
+    DNA = "DNA"
+    PROTEIN = "protein"
+
+    @property
+    def alphabet(self) -> str:
+        """Residues that can be part of an indexed k-mer."""
+        return "ACGT" if self is IndexKind.DNA else _AMINO_ACIDS
+
+    @property
+    def max_k(self) -> int:
+        """Largest k for which the offset table stays below :data:`MAX_TABLE_SIZE` entries."""
+        k = 1
+        while len(self.alphabet) ** (k + 1) <= MAX_TABLE_SIZE:
+            k += 1
+        return k
+
+    def code_table(self) -> npt.NDArray[np.int64]:
+        """256-entry table mapping residues onto their digit in a k-mer code, -1 if invalid."""  # noqa: DOC201
+        table = np.full(256, -1, dtype=np.int64)
+        for digit, residue in enumerate(self.alphabet.encode()):
+            table[residue] = digit
+        if self is IndexKind.DNA:
+            table[ord("U")] = table[ord("T")]
+        return table
+
+    def pattern_table(self) -> dict[str, str]:
+        """Residues every query character is allowed to match."""  # noqa: DOC201
+        return _IUPAC_NUCLEOTIDES if self is IndexKind.DNA else _IUPAC_AMINO_ACIDS
+
+
+class BuildStats(NamedTuple):
+    """Statistics of a :func:`build_index` run."""
+
+    records: int
+    residues: int
+    kmers: int
+    seconds: float
+
+
+class Hit(NamedTuple):
+    """A single search result, positions are 1-based within the record."""
+
+    header: str
+    position: int
+    mismatches: int
+    match: str
+
+
+class SearchResult(NamedTuple):
+    """All hits of a search, ``total`` may be larger than the amount of returned hits."""
+
+    total: int
+    hits: list[Hit]
+
+
+class KmerIndex:
+    """Read-only k-mer index built by :func:`build_index`.
+
+    All large arrays are memory-mapped, so opening an index is cheap and queries only touch the
+    pages they need.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        k: int,
+        kind: IndexKind,
+        residues: npt.NDArray[np.uint8],
+        offsets: npt.NDArray[np.unsignedinteger],
+        positions: npt.NDArray[np.unsignedinteger],
+        record_starts: npt.NDArray[np.int64],
+        headers: list[str],
+    ) -> None:
+        self.k: int = k
+        self.kind: IndexKind = kind
+        self.residues: npt.NDArray[np.uint8] = residues
+        self.offsets: npt.NDArray[np.unsignedinteger] = offsets
+        self.positions: npt.NDArray[np.unsignedinteger] = positions
+        self.record_starts: npt.NDArray[np.int64] = record_starts
+        self.headers: list[str] = headers
+
+    @classmethod
+    def open(cls: type[Self], path: str | Path) -> Self:
+        """Open an index directory.
+
+        Parameters
+        ----------
+        path : str | Path
+            Directory the index was written to.
+
+        Returns
+        -------
+        Self
+            The opened index.
+
+        Raises
+        ------
+        ValueError
+            The index was built by an incompatible version.
+        """
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text(encoding="utf-8"))
+        if meta["version"] != INDEX_VERSION:
+            msg = f"Unsupported index version {meta['version']}, please rebuild the index."
+            raise ValueError(msg)
+
+        return cls(
+            k=meta["k"],
+            kind=IndexKind(meta["kind"]),
+            residues=np.memmap(path / "sequence.bin", dtype=np.uint8, mode="r"),
+            offsets=np.load(path / "offsets.npy", mmap_mode="r"),
+            positions=np.load(path / "positions.npy", mmap_mode="r"),
+            record_starts=np.load(path / "records.npy"),
+            headers=(path / "headers.txt").read_text(encoding="utf-8").splitlines(),
+        )
+
+    @property
+    def record_count(self) -> int:
+        """Amount of records in the database."""
+        return len(self.headers)
+
+    @property
+    def residue_count(self) -> int:
+        """Amount of residues in the database, including record separators."""
+        return int(self.residues.size)
+
+    @property
+    def kmer_count(self) -> int:
+        """Amount of indexed k-mers."""
+        return int(self.positions.size)
+
+    def search(self, query: str, mismatches: int = 0, limit: int = 100) -> SearchResult:
+        """Find all occurrences of a motif, allowing for mismatches but not for gaps.
+
+        Candidates are found by looking up ``mismatches + 1`` disjoint k-mers of the query, at
+        least one of which has to match exactly (pigeonhole principle), and then verified against
+        the memory-mapped residues. IUPAC ambiguity codes are supported. Queries shorter than k
+        are looked up as a k-mer prefix, occurrences within the last k - 1 residues of a record
+        are not found in that case. Invalid, too short or too unspecific queries raise a
+        :class:`ValueError`.
+
+        Parameters
+        ----------
+        query : str
+            The motif to search for.
+        mismatches : int
+            Maximum amount of mismatching positions.
+        limit : int
+            Maximum amount of hits to return, best hits first.
+
+        Returns
+        -------
+        SearchResult
+            The best hits and the total amount of hits.
+        """
+        allowed, digits = self._compile(query)
+        candidates = self._candidates(digits, mismatches)
+        length = digits.size
+
+        candidates = candidates[(candidates >= 0) & (candidates + length <= self.residues.size)]
+
+        hit_starts, hit_counts = self._verify(allowed, candidates, mismatches)
+
+        records = np.searchsorted(self.record_starts, hit_starts, side="right") - 1
+        record_ends = np.append(self.record_starts[1:] - len(RECORD_SEPARATOR), self.residues.size)
+        inside = hit_starts + length <= record_ends[records]
+        hit_starts, hit_counts, records = hit_starts[inside], hit_counts[inside], records[inside]
+
+        order = np.lexsort((hit_starts, hit_counts))[:limit]
+        hits = [
+            Hit(
+                header=self.headers[records[i]],
+                position=int(hit_starts[i] - self.record_starts[records[i]]) + 1,
+                mismatches=int(hit_counts[i]),
+                match=self.residues[hit_starts[i] : hit_starts[i] + length].tobytes().decode(),
+            )
+            for i in order
+        ]
+
+        return SearchResult(total=int(hit_starts.size), hits=hits)
+
+    def _verify(
+        self,
+        allowed: npt.NDArray[np.bool_],
+        candidates: npt.NDArray[np.int64],
+        mismatches: int,
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        # Compares all candidates against the query in batches, returns the start positions and
+        # mismatch counts of those that match.
+        length = allowed.shape[0]
+        columns = np.arange(length)
+        batch_size = max(1, VERIFY_BATCH_SIZE // length)
+        starts: list[npt.NDArray[np.int64]] = [np.empty(0, dtype=np.int64)]
+        counts: list[npt.NDArray[np.int64]] = [np.empty(0, dtype=np.int64)]
+
+        for batch_start in range(0, candidates.size, batch_size):
+            batch = candidates[batch_start : batch_start + batch_size]
+            windows = self.residues[batch[:, None] + columns]
+            mismatch_counts = length - allowed[columns, windows].sum(axis=1)
+            keep = mismatch_counts <= mismatches
+            starts.append(batch[keep])
+            counts.append(mismatch_counts[keep])
+
+        return np.concatenate(starts), np.concatenate(counts)
+
+    def _compile(self, query: str) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.int64]]:
+        # Returns which residues every query position matches, and the k-mer digit of every
+        # position (-1 if ambiguous).
+        query = "".join(query.split()).upper()
+        if not query:
+            msg = "The query is empty."
+            raise ValueError(msg)
+
+        patterns = self.kind.pattern_table()
+        allowed = np.zeros((len(query), 256), dtype=np.bool_)
+        for position, char in enumerate(query):
+            if char not in patterns:
+                msg = f"Invalid character {char!r} in {self.kind.value} query."
+                raise ValueError(msg)
+            allowed[position, list(patterns[char].encode())] = True
+
+        digits = self.kind.code_table()[np.frombuffer(query.encode(), dtype=np.uint8)]
+        return allowed, digits
+
+    def _candidates(self, digits: npt.NDArray[np.int64], mismatches: int) -> npt.NDArray[np.int64]:
+        # Start positions of every possible match, found through exact k-mer lookups.
+        k, base = self.k, len(self.kind.alphabet)
+
+        if digits.size < k:
+            if mismatches or (digits < 0).any():
+                msg = f"Queries shorter than {k} residues must be exact and unambiguous."
+                raise ValueError(msg)
+
+            prefix = _encode(digits, base)
+            low = prefix * base ** (k - digits.size)
+            high = (prefix + 1) * base ** (k - digits.size)
+            first, last = int(self.offsets[low]), int(self.offsets[high])
+            self._check_candidate_count(last - first)
+            return self.positions[first:last].astype(np.int64)
+
+        seeds: list[tuple[int, int]] = []
+        position = 0
+        while position + k <= digits.size:
+            window = digits[position : position + k]
+            ambiguous = np.flatnonzero(window < 0)
+            if ambiguous.size:
+                position += int(ambiguous[-1]) + 1
+                continue
+
+            seeds.append((position, _encode(window, base)))
+            position += k
+
+        if len(seeds) <= mismatches:
+            msg = (
+                f"Searching with {mismatches} mismatch(es) needs {mismatches + 1} separate "
+                f"stretches of {k} unambiguous residues in the query."
+            )
+            raise ValueError(msg)
+
+        # Any mismatches + 1 disjoint seeds contain an exact one, so use the rarest.
+        seeds.sort(key=lambda seed: int(self.offsets[seed[1] + 1] - self.offsets[seed[1]]))
+        seeds = seeds[: mismatches + 1]
+        self._check_candidate_count(
+            sum(int(self.offsets[code + 1] - self.offsets[code]) for _offset, code in seeds)
+        )
+
+        return np.unique(
+            np.concatenate([
+                self.positions[int(self.offsets[code]) : int(self.offsets[code + 1])].astype(
+                    np.int64
+                )
+                - offset
+                for offset, code in seeds
+            ])
+        )
+
+    @staticmethod
+    def _check_candidate_count(count: int) -> None:
+        if count > MAX_CANDIDATES:
+            msg = "The query matches too many places, please use a longer query."
+            raise ValueError(msg)
+
+
+def _encode(digits: npt.NDArray[np.int64], base: int) -> int:
+    code = 0
+    for digit in digits.tolist():
+        code = code * base + digit
+    return code
+
+
+def build_index(
+    fasta_path: str | Path,
+    index_path: str | Path,
+    k: int,
+    kind: IndexKind = IndexKind.DNA,
+) -> BuildStats:
+    """Build an on-disk k-mer index over a (multi-record) FASTA file.
+
+    The FASTA file is streamed in blocks into a flat residue file, after which the k-mers are
+    counted and scattered into a position array one chunk at a time. Memory use stays bounded by
+    the chunk size and the offset table, regardless of the database size.
+
+    Parameters
+    ----------
+    fasta_path : str | Path
+        The FASTA file to index.
+    index_path : str | Path
+        Directory to write the index to, it is created if it does not exist.
+    k : int
+        Length of the indexed k-mers.
+    kind : IndexKind
+        Whether the database contains DNA or protein sequences.
+
+    Returns
+    -------
+    BuildStats
+        Statistics of the build.
+
+    Raises
+    ------
+    ValueError
+        ``k`` is out of range for the alphabet.
+    """
+    if not 1 <= k <= kind.max_k:
+        msg = f"k must be between 1 and {kind.max_k} for a {kind.value} index."
+        raise ValueError(msg)
+
+    start = time.perf_counter()
+    index_path = Path(index_path)
+    index_path.mkdir(parents=True, exist_ok=True)
+
+    record_starts, headers = _write_residues(Path(fasta_path), index_path / "sequence.bin")
+    if not record_starts:
+        msg = "The FASTA file does not contain any sequences."
+        raise ValueError(msg)
+
+    residues = np.memmap(index_path / "sequence.bin", dtype=np.uint8, mode="r")
+    total = _write_positions(residues, k, kind, index_path)
+
+    np.save(index_path / "records.npy", np.asarray(record_starts, dtype=np.int64))
+    (index_path / "headers.txt").write_text("\n".join(headers) + "\n", encoding="utf-8")
+    (index_path / "meta.json").write_text(
+        json.dumps({"version": INDEX_VERSION, "k": k, "kind": kind.value}), encoding="utf-8"
+    )
+
+    return BuildStats(
+        records=len(headers),
+        residues=int(residues.size),
+        kmers=total,
+        seconds=time.perf_counter() - start,
+    )
+
+
+def _write_positions(
+    residues: npt.NDArray[np.uint8], k: int, kind: IndexKind, index_path: Path
+) -> int:
+    # Counting sort: the first pass counts every k-mer to get the offset of its positions, the
+    # second pass scatters the positions of every chunk into their slots.
+    table_size = len(kind.alphabet) ** k
+    counts = np.zeros(table_size, dtype=np.int64)
+    for _chunk_start, codes, _offsets in _chunk_kmers(residues, k, kind):
+        counts += np.bincount(codes, minlength=table_size)
+
+    total = int(counts.sum())
+    dtype = np.uint32 if residues.size < 2**32 else np.uint64
+
+    offsets = np.zeros(table_size + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    np.save(index_path / "offsets.npy", offsets.astype(dtype))
+
+    positions = np.lib.format.open_memmap(
+        index_path / "positions.npy", mode="w+", dtype=dtype, shape=(total,)
+    )
+    # Packing the chunk offset into the low bits of the key makes a plain (SIMD) sort stable.
+    offset_bits = (CHUNK_SIZE - 1).bit_length()
+    cursor = offsets[:-1].copy()
+    for chunk_start, codes, chunk_offsets in _chunk_kmers(residues, k, kind):
+        keys = np.sort((codes.astype(np.uint64) << offset_bits) | chunk_offsets)
+        sorted_codes = (keys >> offset_bits).astype(np.int64)
+
+        group_starts = np.flatnonzero(np.diff(sorted_codes, prepend=-1))
+        group_sizes = np.diff(group_starts, append=sorted_codes.size)
+        rank = np.arange(sorted_codes.size) - np.repeat(group_starts, group_sizes)
+
+        positions[cursor[sorted_codes] + rank] = chunk_start + (
+            keys & ((1 << offset_bits) - 1)
+        ).astype(np.int64)
+        cursor[sorted_codes[group_starts]] += group_sizes
+    positions.flush()
+
+    return total
+
+
+def _write_residues(fasta_path: Path, output_path: Path) -> tuple[list[int], list[str]]:
+    # Streams the FASTA file into a flat file of uppercase residues, records are separated by
+    # RECORD_SEPARATOR so no k-mer or match can span two records.
+    record_starts: list[int] = []
+    headers: list[str] = []
+    written = 0
+
+    with fasta_path.open("rb") as fasta, output_path.open("wb") as output:
+
+        def process(text: bytes) -> None:
+            nonlocal written
+            previous = 0
+            for match in _HEADER.finditer(text):
+                body = text[previous : match.start()].translate(None, _WHITESPACE).upper()
+                if body and not record_starts:
+                    record_starts.append(0)
+                    headers.append("sequence")
+                output.write(body)
+                written += len(body)
+
+                if record_starts:
+                    output.write(RECORD_SEPARATOR)
+                    written += len(RECORD_SEPARATOR)
+                record_starts.append(written)
+                headers.append(match.group(1).decode(errors="replace").strip())
+                previous = match.end()
+
+            body = text[previous:].translate(None, _WHITESPACE).upper()
+            if body and not record_starts:
+                record_starts.append(0)
+                headers.append("sequence")
+            output.write(body)
+            written += len(body)
+
+        pending = b""
+        while block := fasta.read(READ_BLOCK_SIZE):
+            pending += block
+            cut = pending.rfind(b"\n")
+            if cut == -1:
+                continue
+            process(pending[: cut + 1])
+            pending = pending[cut + 1 :]
+        process(pending)
+
+    return record_starts, headers
+
+
+def _chunk_kmers(
+    residues: npt.NDArray[np.uint8], k: int, kind: IndexKind
+) -> Iterator[tuple[int, npt.NDArray[np.uint32], npt.NDArray[np.uint64]]]:
+    # Yields the codes and offsets within the chunk of all valid k-mers, one chunk at a time.
+    table = kind.code_table().astype(np.int8)
+    base = len(kind.alphabet)
+    window_total = residues.size - k + 1
+
+    for chunk_start in range(0, max(window_total, 0), CHUNK_SIZE):
+        window_count = min(CHUNK_SIZE, window_total - chunk_start)
+        digits = table[residues[chunk_start : chunk_start + window_count + k - 1]]
+
+        invalid = np.zeros(digits.size + 1, dtype=np.int32)
+        np.cumsum(digits < 0, out=invalid[1:])
+        valid = invalid[k:] == invalid[:-k]
+
+        codes = np.zeros(window_count, dtype=np.uint32)
+        for offset in range(k):
+            codes *= base
+            codes += digits[offset : offset + window_count].view(np.uint8)
+
+        yield chunk_start, codes[valid], np.flatnonzero(valid).astype(np.uint64)
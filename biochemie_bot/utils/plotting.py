@@ -0,0 +1,47 @@
+import io
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+def new_figure(width: float = 8, height: float = 5) -> Figure:
+    """Create a figure which can be rendered outside of the main thread.
+
+    Uses the object-oriented API with the Agg canvas, :mod:`matplotlib.pyplot` keeps global
+    state and should not be used by the bot.
+
+    Parameters
+    ----------
+    width : float
+        Width in inches.
+    height : float
+        Height in inches.
+
+    Returns
+    -------
+    Figure
+        The new figure.
+    """
+    figure = Figure(figsize=(width, height), layout="tight")
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def figure_to_png(figure: Figure, dpi: int = 120) -> bytes:
+    """Render a figure to PNG.
+
+    Parameters
+    ----------
+    figure : Figure
+        The figure to render.
+    dpi : int
+        Resolution of the image.
+
+    Returns
+    -------
+    bytes
+        The rendered image.
+    """
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format="png", dpi=dpi)
+    return buffer.getvalue()
@@ -0,0 +1,493 @@
+from enum import Enum
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+type ByteArray = npt.NDArray[np.uint8]
+
+WATER_MASS = 18.01528
+
+PROTEIN_ALPHABET = b"ACDEFGHIKLMNPQRSTVWYBZXUO*"
+NUCLEOTIDE_ALPHABET = b"ACGTUN"
+AMBIGUITY_CODES = b"RYKMBVDHSW"
+
+# Sequences made of nucleotide and ambiguity codes are only nucleotide sequences when at least
+# this fraction are unambiguous bases, otherwise short peptides like `MKWV` would be DNA.
+MIN_UNAMBIGUOUS_FRACTION = 0.5
+
+# Average residue masses, the mass of the free amino acid minus one water.
+_RESIDUE_MASSES: dict[bytes, float] = {
+    b"A": 71.0788,
+    b"R": 156.1875,
+    b"N": 114.1038,
+    b"D": 115.0886,
+    b"C": 103.1388,
+    b"E": 129.1155,
+    b"Q": 128.1307,
+    b"G": 57.0519,
+    b"H": 137.1411,
+    b"I": 113.1594,
+    b"L": 113.1594,
+    b"K": 128.1741,
+    b"M": 131.1926,
+    b"F": 147.1766,
+    b"P": 97.1167,
+    b"S": 87.0782,
+    b"T": 101.1051,
+    b"W": 186.2132,
+    b"Y": 163.1760,
+    b"V": 99.1326,
+    b"U": 150.0388,
+    b"O": 237.3018,
+    b"B": 114.5962,
+    b"Z": 128.6231,
+    b"X": 110.0,
+}
+
+# Nucleotide monophosphate masses within a strand, see
+# https://www.thermofisher.com/nl/en/home/references/ambion-tech-support/rna-tools-and-calculators/dna-and-rna-molecular-weights-and-conversions.html
+_DNA_MASSES: dict[bytes, float] = {
+    b"A": 313.21,
+    b"C": 289.18,
+    b"G": 329.21,
+    b"T": 304.2,
+    b"N": 308.95,
+}
+_RNA_MASSES: dict[bytes, float] = {
+    b"A": 329.21,
+    b"C": 305.18,
+    b"G": 345.21,
+    b"U": 306.17,
+    b"N": 321.44,
+}
+_DNA_MASS_OFFSET = -61.96
+_RNA_MASS_OFFSET = 159.0
+
+# EMBOSS pKa values of the ionizable side chains and termini.
+_POSITIVE_PKA: dict[bytes, float] = {b"K": 10.8, b"R": 12.5, b"H": 6.5}
+_NEGATIVE_PKA: dict[bytes, float] = {b"D": 3.9, b"E": 4.1, b"C": 8.5, b"Y": 10.1}
+_N_TERMINUS_PKA = 8.6
+_C_TERMINUS_PKA = 3.6
+
+_TRYPTOPHAN_EXTINCTION = 5500
+_TYROSINE_EXTINCTION = 1490
+_CYSTINE_EXTINCTION = 125
+
+_CODON_TABLE = b"KNKNTTTTRSRSIIMIQHQHPPPPRRRRLLLLEDEDAAAAGGGGVVVV*Y*YSSSS*CWCLFLF"
+
+
+def _table(values: dict[bytes, float], default: float = 0.0) -> npt.NDArray[np.float64]:
+    table = np.full(256, default, dtype=np.float64)
+    for char, value in values.items():
+        table[char[0]] = value
+        table[char.lower()[0]] = value
+    return table
+
+
+def _membership(alphabet: bytes) -> npt.NDArray[np.bool_]:
+    table = np.zeros(256, dtype=np.bool_)
+    table[np.frombuffer(alphabet, dtype=np.uint8)] = True
+    table[np.frombuffer(alphabet.lower(), dtype=np.uint8)] = True
+    return table
+
+
+RESIDUE_MASS_TABLE = _table(_RESIDUE_MASSES)
+# Ambiguous bases weigh as much as an unknown base.
+DNA_MASS_TABLE = _table(
+    _DNA_MASSES | {bytes([code]): _DNA_MASSES[b"N"] for code in AMBIGUITY_CODES}
+)
+RNA_MASS_TABLE = _table(
+    _RNA_MASSES | {bytes([code]): _RNA_MASSES[b"N"] for code in AMBIGUITY_CODES}
+)
+PROTEIN_TABLE = _membership(PROTEIN_ALPHABET)
+NUCLEOTIDE_TABLE = _membership(NUCLEOTIDE_ALPHABET)
+IUPAC_NUCLEOTIDE_TABLE = _membership(NUCLEOTIDE_ALPHABET + AMBIGUITY_CODES)
+
+COMPLEMENT_TABLE = np.arange(256, dtype=np.uint8)
+for _base, _complement in zip(
+    NUCLEOTIDE_ALPHABET + AMBIGUITY_CODES, b"TGCAANYRMKVBHDSW", strict=True
+):
+    COMPLEMENT_TABLE[_base] = _complement
+    COMPLEMENT_TABLE[ord(chr(_base).lower())] = ord(chr(_complement).lower())
+
+# Maps a nucleotide onto its index in the codon table, 4 marks an unknown base.
+BASE_INDEX_TABLE = np.full(256, 4, dtype=np.uint8)
+for _index, _base in enumerate(b"ACGT"):
+    BASE_INDEX_TABLE[_base] = _index
+    BASE_INDEX_TABLE[ord(chr(_base).lower())] = _index
+BASE_INDEX_TABLE[ord("U")] = BASE_INDEX_TABLE[ord("u")] = 3
+
+CODON_TABLE = np.frombuffer(_CODON_TABLE, dtype=np.uint8)
+
+_WHITESPACE = b" \t\r\n\v\f0123456789"
+
+del _base, _complement, _index
+
+
+class SequenceKind(Enum):
+    """The kind of molecule a sequence describes."""
+
+    DNA = "DNA"
+    RNA = "RNA"
+    PROTEIN = "protein"
+
+
+class FastaRecord(NamedTuple):
+    """A single FASTA record."""
+
+    header: str
+    sequence: ByteArray
+
+
+class NucleotideProperties(NamedTuple):
+    """Computed properties of a DNA or RNA sequence."""
+
+    kind: SequenceKind
+    length: int
+    molecular_weight: float
+    gc_content: float
+
+
+class ProteinProperties(NamedTuple):
+    """Computed properties of a protein sequence."""
+
+    length: int
+    molecular_weight: float
+    isoelectric_point: float
+    extinction_coefficient_reduced: int
+    extinction_coefficient_oxidized: int
+
+
+def to_array(sequence: str | bytes) -> ByteArray:
+    """Convert a sequence into an uppercase byte array, stripping whitespace and digits.
+
+    Parameters
+    ----------
+    sequence : str | bytes
+        The raw sequence, as pasted or read from a file.
+
+    Returns
+    -------
+    ByteArray
+        The cleaned up sequence.
+    """
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii", errors="replace")
+
+    return np.frombuffer(sequence.translate(None, _WHITESPACE).upper(), dtype=np.uint8)
+
+
+def parse_fasta(data: str | bytes) -> list[FastaRecord]:
+    """Parse single or multi-record FASTA, plain sequences are returned as one record.
+
+    Parameters
+    ----------
+    data : str | bytes
+        FASTA formatted text.
+
+    Returns
+    -------
+    list[FastaRecord]
+        All records with a non-empty sequence.
+    """
+    if isinstance(data, str):
+        data = data.encode("ascii", errors="replace")
+
+    data = data.strip()
+    if not data.startswith(b">"):
+        return [FastaRecord("sequence", to_array(data))]
+
+    records: list[FastaRecord] = []
+    for chunk in data[1:].split(b"\n>"):
+        header, _, body = chunk.partition(b"\n")
+        sequence = to_array(body)
+        if sequence.size:
+            records.append(FastaRecord(header.decode(errors="replace").strip(), sequence))
+
+    return records
+
+
+def residue_counts(sequence: ByteArray) -> npt.NDArray[np.intp]:
+    """Count every byte value in a sequence.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The sequence to count.
+
+    Returns
+    -------
+    npt.NDArray[np.intp]
+        Array of length 256, indexed by byte value.
+    """
+    return np.bincount(sequence, minlength=256)
+
+
+def detect_kind(sequence: ByteArray) -> SequenceKind:
+    """Guess whether a sequence is DNA, RNA or protein.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The sequence to inspect.
+
+    Returns
+    -------
+    SequenceKind
+        Sequences of IUPAC nucleotide codes, mostly unambiguous bases, are DNA or RNA, those
+        containing ``U`` but no ``T`` are RNA.
+
+    Raises
+    ------
+    ValueError
+        The sequence contains characters that are not valid residues.
+    """
+    counts = residue_counts(sequence)
+    present = counts > 0
+
+    unambiguous = counts[NUCLEOTIDE_TABLE].sum()
+    if (
+        not present[~IUPAC_NUCLEOTIDE_TABLE].any()
+        and unambiguous >= MIN_UNAMBIGUOUS_FRACTION * sequence.size
+    ):
+        if counts[ord("U")] and not counts[ord("T")]:
+            return SequenceKind.RNA
+        return SequenceKind.DNA
+
+    if present[~PROTEIN_TABLE].any():
+        invalid = bytes(np.flatnonzero(present & ~PROTEIN_TABLE).astype(np.uint8))
+        msg = f"Invalid sequence characters: {invalid.decode(errors='replace')!r}"
+        raise ValueError(msg)
+
+    return SequenceKind.PROTEIN
+
+
+def gc_content(sequence: ByteArray) -> float:
+    """Calculate the fraction of G and C bases, ignoring ambiguous bases.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        A DNA or RNA sequence.
+
+    Returns
+    -------
+    float
+        GC fraction between 0 and 1.
+    """
+    counts = residue_counts(sequence)
+    gc = counts[ord("G")] + counts[ord("C")]
+    total = gc + counts[ord("A")] + counts[ord("T")] + counts[ord("U")]
+    return float(gc / total) if total else 0.0
+
+
+def nucleotide_molecular_weight(sequence: ByteArray, kind: SequenceKind) -> float:
+    """Calculate the molecular weight of a single stranded DNA or RNA sequence.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The nucleotide sequence.
+    kind : SequenceKind
+        Either :attr:`SequenceKind.DNA` or :attr:`SequenceKind.RNA`.
+
+    Returns
+    -------
+    float
+        Molecular weight in Dalton.
+    """
+    if kind is SequenceKind.RNA:
+        return float(residue_counts(sequence) @ RNA_MASS_TABLE) + _RNA_MASS_OFFSET
+    return float(residue_counts(sequence) @ DNA_MASS_TABLE) + _DNA_MASS_OFFSET
+
+
+def protein_molecular_weight(sequence: ByteArray) -> float:
+    """Calculate the average molecular weight of a protein sequence.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The protein sequence.
+
+    Returns
+    -------
+    float
+        Molecular weight in Dalton.
+    """
+    return float(residue_counts(sequence) @ RESIDUE_MASS_TABLE) + WATER_MASS
+
+
+def protein_charge(counts: npt.NDArray[np.intp], ph: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """Calculate the net charge of a protein at one or more pH values.
+
+    Parameters
+    ----------
+    counts : npt.NDArray[np.intp]
+        Residue counts, as returned by :func:`residue_counts`.
+    ph : npt.ArrayLike
+        The pH value(s) to evaluate.
+
+    Returns
+    -------
+    npt.NDArray[np.float64]
+        Net charge for every given pH value.
+    """
+    ph = np.asarray(ph, dtype=np.float64)
+
+    positive = 1 / (1 + 10 ** (ph - _N_TERMINUS_PKA))
+    for residue, pka in _POSITIVE_PKA.items():
+        positive += counts[residue[0]] / (1 + 10 ** (ph - pka))
+
+    negative = 1 / (1 + 10 ** (_C_TERMINUS_PKA - ph))
+    for residue, pka in _NEGATIVE_PKA.items():
+        negative += counts[residue[0]] / (1 + 10 ** (pka - ph))
+
+    return positive - negative
+
+
+def isoelectric_point(sequence: ByteArray, precision: float = 0.001) -> float:
+    """Calculate the isoelectric point of a protein sequence.
+
+    The net charge is evaluated on a whole pH grid at once, the grid is then narrowed around the
+    sign change until the requested precision is reached.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The protein sequence.
+    precision : float
+        Maximum error of the returned pH.
+
+    Returns
+    -------
+    float
+        The pH at which the protein has no net charge.
+    """
+    counts = residue_counts(sequence)
+    low, high = 0.0, 14.0
+
+    while high - low > precision:
+        grid = np.linspace(low, high, 101)
+        charge = protein_charge(counts, grid)
+        neutral = charge <= 0
+        if not neutral.any():
+            # Still positive at the upper bound, e.g. poly-arginine.
+            return high
+
+        crossing = int(np.argmax(neutral))
+        if crossing == 0:
+            return float(grid[0])
+
+        low, high = float(grid[crossing - 1]), float(grid[crossing])
+
+    return (low + high) / 2
+
+
+def extinction_coefficients(sequence: ByteArray) -> tuple[int, int]:
+    """Calculate the molar extinction coefficient at 280 nm.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The protein sequence.
+
+    Returns
+    -------
+    tuple[int, int]
+        The coefficient assuming all cysteines are reduced, and assuming all form cystines.
+    """
+    counts = residue_counts(sequence)
+    reduced = counts[ord("W")] * _TRYPTOPHAN_EXTINCTION + counts[ord("Y")] * _TYROSINE_EXTINCTION
+    oxidized = reduced + counts[ord("C")] // 2 * _CYSTINE_EXTINCTION
+    return int(reduced), int(oxidized)
+
+
+def reverse_complement(sequence: ByteArray) -> ByteArray:
+    """Reverse complement a DNA or RNA sequence, IUPAC ambiguity codes are supported.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The nucleotide sequence.
+
+    Returns
+    -------
+    ByteArray
+        The reverse complement, ``U`` is complemented to ``A``.
+    """
+    return COMPLEMENT_TABLE[sequence[::-1]]
+
+
+def translate(sequence: ByteArray, frame: int = 0) -> ByteArray:
+    """Translate a DNA or RNA sequence using the standard genetic code.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The nucleotide sequence.
+    frame : int
+        Reading frame offset, 0, 1 or 2.
+
+    Returns
+    -------
+    ByteArray
+        The protein sequence, stop codons are ``*`` and codons with unknown bases ``X``.
+    """
+    codon_count = (sequence.size - frame) // 3
+    if codon_count <= 0:
+        return np.empty(0, dtype=np.uint8)
+
+    bases = BASE_INDEX_TABLE[sequence[frame : frame + codon_count * 3]].reshape(-1, 3)
+    unknown = (bases == 4).any(axis=1)  # noqa: PLR2004
+    codons = (bases[:, 0].astype(np.intp) << 4) | (bases[:, 1] << 2) | bases[:, 2]
+
+    protein = CODON_TABLE[codons & 63]
+    protein[unknown] = ord("X")
+    return protein
+
+
+def nucleotide_properties(sequence: ByteArray, kind: SequenceKind) -> NucleotideProperties:
+    """Calculate all properties of a DNA or RNA sequence.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The nucleotide sequence.
+    kind : SequenceKind
+        Either :attr:`SequenceKind.DNA` or :attr:`SequenceKind.RNA`.
+
+    Returns
+    -------
+    NucleotideProperties
+        The computed properties.
+    """
+    return NucleotideProperties(
+        kind=kind,
+        length=int(sequence.size),
+        molecular_weight=nucleotide_molecular_weight(sequence, kind),
+        gc_content=gc_content(sequence),
+    )
+
+
+def protein_properties(sequence: ByteArray) -> ProteinProperties:
+    """Calculate all properties of a protein sequence.
+
+    Parameters
+    ----------
+    sequence : ByteArray
+        The protein sequence.
+
+    Returns
+    -------
+    ProteinProperties
+        The computed properties.
+    """
+    reduced, oxidized = extinction_coefficients(sequence)
+    return ProteinProperties(
+        length=int(sequence.size),
+        molecular_weight=protein_molecular_weight(sequence),
+        isoelectric_point=isoelectric_point(sequence),
+        extinction_coefficient_reduced=reduced,
+        extinction_coefficient_oxidized=oxidized,
+    )
@@ -0,0 +1,418 @@
+import functools
+import math
+from collections.abc import Callable
+from enum import Enum
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from biochemie_bot.utils.plotting import figure_to_png, new_figure
+
+type FloatArray = npt.NDArray[np.float64]
+
+PKW = 14.0
+MAX_PKAS = 6
+CURVE_POINTS = 2001
+BISECTION_ITERATIONS = 50
+PH_BOUNDS = (-2.0, 16.0)
+CACHE_SIZE = 64
+
+
+class Titrant(Enum):
+    """Strong acid or base added to the analyte."""
+
+    BASE = "NaOH"
+    ACID = "HCl"
+
+
+class Analyte(NamedTuple):
+    """A (polyprotic) acid, described by its fully protonated form.
+
+    ``charge`` is the charge of the fully protonated form, 0 for acids like H3PO4, 1 for the
+    cationic form of most amino acids and 2 for lysine, arginine and histidine.
+    """
+
+    name: str
+    pkas: tuple[float, ...]
+    charge: int = 0
+
+    @property
+    def has_isoelectric_point(self) -> bool:
+        """Whether a neutral form exists between a cationic and an anionic form."""
+        return 1 <= self.charge <= len(self.pkas) - 1
+
+
+class TitrationParameters(NamedTuple):
+    """Everything needed to simulate a titration, concentrations in M and volumes in mL."""
+
+    analyte: Analyte
+    concentration: float
+    volume: float
+    titrant: Titrant
+    titrant_concentration: float
+    max_volume: float
+
+
+class KeyPoint(NamedTuple):
+    """A labelled point on a titration curve."""
+
+    label: str
+    volume: float
+    ph: float
+
+
+class TitrationCurve(NamedTuple):
+    """A simulated titration curve and its key points."""
+
+    volume: FloatArray
+    ph: FloatArray
+    equivalence_points: tuple[KeyPoint, ...]
+    half_equivalence_points: tuple[KeyPoint, ...]
+    isoelectric_point: float | None
+
+
+class BufferState(NamedTuple):
+    """Composition of a buffer at a given pH."""
+
+    fractions: tuple[float, ...]
+    mean_charge: float
+    capacity: float
+
+
+# pKa values at 25 °C, amino acids as listed in Lehninger's Principles of Biochemistry.
+PRESETS: tuple[Analyte, ...] = (
+    Analyte("Glycine", (2.34, 9.60), 1),
+    Analyte("Alanine", (2.34, 9.69), 1),
+    Analyte("Valine", (2.32, 9.62), 1),
+    Analyte("Leucine", (2.36, 9.60), 1),
+    Analyte("Isoleucine", (2.36, 9.68), 1),
+    Analyte("Proline", (1.99, 10.96), 1),
+    Analyte("Phenylalanine", (1.83, 9.13), 1),
+    Analyte("Tryptophan", (2.38, 9.39), 1),
+    Analyte("Methionine", (2.28, 9.21), 1),
+    Analyte("Serine", (2.21, 9.15), 1),
+    Analyte("Threonine", (2.11, 9.62), 1),
+    Analyte("Asparagine", (2.02, 8.80), 1),
+    Analyte("Glutamine", (2.17, 9.13), 1),
+    Analyte("Cysteine", (1.96, 8.18, 10.28), 1),
+    Analyte("Tyrosine", (2.20, 9.11, 10.07), 1),
+    Analyte("Aspartic acid", (1.88, 3.65, 9.60), 1),
+    Analyte("Glutamic acid", (2.19, 4.25, 9.67), 1),
+    Analyte("Histidine", (1.82, 6.00, 9.17), 2),
+    Analyte("Lysine", (2.18, 8.95, 10.53), 2),
+    Analyte("Arginine", (2.17, 9.04, 12.48), 2),
+    Analyte("Hydrochloric acid", (-6.3,)),
+    Analyte("Sulfuric acid", (-3.0, 1.99)),
+    Analyte("Oxalic acid", (1.25, 4.27)),
+    Analyte("Phosphoric acid", (2.15, 7.20, 12.35)),
+    Analyte("Citric acid", (3.13, 4.76, 6.40)),
+    Analyte("Formic acid", (3.75,)),
+    Analyte("Lactic acid", (3.86,)),
+    Analyte("Succinic acid", (4.21, 5.64)),
+    Analyte("Acetic acid", (4.76,)),
+    Analyte("Carbonic acid", (6.35, 10.33)),
+    Analyte("Tris", (8.07,), 1),
+    Analyte("Ammonia", (9.25,), 1),
+)
+
+
+def parse_pkas(text: str) -> tuple[float, ...]:
+    """Parse comma or space separated pKa values.
+
+    Parameters
+    ----------
+    text : str
+        The pKa values.
+
+    Returns
+    -------
+    tuple[float, ...]
+        The values in ascending order.
+
+    Raises
+    ------
+    ValueError
+        The text contains something other than numbers, too many values or unlikely values.
+    """
+    try:
+        pkas = tuple(sorted(float(value) for value in text.replace(",", " ").split()))
+    except ValueError:
+        msg = f"`{text[:100]}` is neither a known analyte nor a list of pKa values."
+        raise ValueError(msg) from None
+
+    if not pkas or len(pkas) > MAX_PKAS:
+        msg = f"Please give between 1 and {MAX_PKAS} pKa values."
+        raise ValueError(msg)
+
+    if not all(-10 <= pka <= 20 for pka in pkas):  # noqa: PLR2004
+        msg = "pKa values must be between -10 and 20."
+        raise ValueError(msg)
+
+    return pkas
+
+
+def fractions(ph: FloatArray, pkas: tuple[float, ...]) -> FloatArray:
+    """Fraction of each protonation state at every pH.
+
+    Parameters
+    ----------
+    ph : FloatArray
+        The pH values, any shape.
+    pkas : tuple[float, ...]
+        The pKa values in ascending order.
+
+    Returns
+    -------
+    FloatArray
+        Array with one extra trailing axis, where index ``j`` is the fraction of the form with
+        ``j`` protons removed.
+    """
+    # log10 of the unnormalized fractions: sum of the first j pKa's subtracted from j·pH.
+    removed = np.arange(len(pkas) + 1)
+    log_beta = -np.concatenate(([0.0], np.cumsum(pkas)))
+    exponents = np.multiply.outer(ph, removed) + log_beta
+
+    exponents -= exponents.max(axis=-1, keepdims=True)
+    weights = np.power(10.0, exponents)
+    return weights / weights.sum(axis=-1, keepdims=True)
+
+
+def _bisect(residual: Callable[[FloatArray], FloatArray], shape: tuple[int, ...]) -> FloatArray:
+    """Find the pH where an increasing residual is zero, for all elements at once."""  # noqa: DOC201
+    lower = np.full(shape, PH_BOUNDS[0])
+    upper = np.full(shape, PH_BOUNDS[1])
+
+    for _ in range(BISECTION_ITERATIONS):
+        middle = (lower + upper) / 2
+        positive = residual(middle) > 0
+        upper = np.where(positive, middle, upper)
+        lower = np.where(positive, lower, middle)
+
+    return (lower + upper) / 2
+
+
+def titration_ph(parameters: TitrationParameters, volume: FloatArray) -> FloatArray:
+    """Solve the charge balance for the pH after adding each volume of titrant.
+
+    The charge balance is monotonic in pH, so it is solved by bisecting all volumes at once.
+    Activities are taken to be equal to concentrations.
+
+    Parameters
+    ----------
+    parameters : TitrationParameters
+        The titration to simulate.
+    volume : FloatArray
+        Added volumes of titrant in mL.
+
+    Returns
+    -------
+    FloatArray
+        The pH after each addition.
+    """
+    analyte = parameters.analyte
+    total_volume = parameters.volume + volume
+    analyte_total = parameters.concentration * parameters.volume / total_volume
+    titrant_total = parameters.titrant_concentration * volume / total_volume
+
+    # The acid starts fully protonated when titrated with a base, fully deprotonated otherwise.
+    if parameters.titrant is Titrant.BASE:
+        start, added_base = 0, titrant_total
+    else:
+        start, added_base = len(analyte.pkas), -titrant_total
+
+    removed = np.arange(len(analyte.pkas) + 1)
+
+    def residual(ph: FloatArray) -> FloatArray:
+        mean_removed = fractions(ph, analyte.pkas) @ removed
+        hydrogen = np.power(10.0, -ph)
+        hydroxide = np.power(10.0, ph - PKW)
+        return analyte_total * (mean_removed - start) + hydroxide - hydrogen - added_base
+
+    return _bisect(residual, volume.shape)
+
+
+def isoelectric_point(analyte: Analyte) -> float | None:
+    """Find the pH at which the mean charge of an ampholyte is zero.
+
+    Parameters
+    ----------
+    analyte : Analyte
+        The ampholyte.
+
+    Returns
+    -------
+    float | None
+        The isoelectric point, or None if the analyte has no neutral form between a cationic
+        and an anionic form.
+    """
+    if not analyte.has_isoelectric_point:
+        return None
+
+    removed = np.arange(len(analyte.pkas) + 1)
+
+    def residual(ph: FloatArray) -> FloatArray:
+        return fractions(ph, analyte.pkas) @ removed - analyte.charge
+
+    return float(_bisect(residual, (1,))[0])
+
+
+def equivalence_volume(parameters: TitrationParameters) -> float:
+    """Volume of titrant in mL needed to remove or add one proton per analyte molecule.
+
+    Parameters
+    ----------
+    parameters : TitrationParameters
+        The titration.
+
+    Returns
+    -------
+    float
+        The volume of the first equivalence point.
+    """
+    return parameters.concentration * parameters.volume / parameters.titrant_concentration
+
+
+def simulate(parameters: TitrationParameters, points: int = CURVE_POINTS) -> TitrationCurve:
+    """Simulate a titration curve and find its key points.
+
+    Parameters
+    ----------
+    parameters : TitrationParameters
+        The titration to simulate.
+    points : int
+        Amount of titrant volumes to solve.
+
+    Returns
+    -------
+    TitrationCurve
+        The curve together with its (half) equivalence points and isoelectric point.
+    """
+    first = equivalence_volume(parameters)
+    steps = np.arange(1, len(parameters.analyte.pkas) + 1)
+    steps = steps[steps * first <= parameters.max_volume]
+
+    volume = np.linspace(0, parameters.max_volume, points, dtype=np.float64)
+    key_volumes = np.concatenate((steps * first, (steps - 0.5) * first), dtype=np.float64)
+    ph = titration_ph(parameters, np.concatenate((volume, key_volumes), dtype=np.float64))
+    key_ph = ph[points:]
+
+    return TitrationCurve(
+        volume=volume,
+        ph=ph[:points],
+        equivalence_points=tuple(
+            KeyPoint(f"EP{step}", float(step * first), float(value))
+            for step, value in zip(steps, key_ph[: steps.size], strict=True)
+        ),
+        half_equivalence_points=tuple(
+            KeyPoint(f"½EP{step}", float((step - 0.5) * first), float(value))
+            for step, value in zip(steps, key_ph[steps.size :], strict=True)
+        ),
+        isoelectric_point=isoelectric_point(parameters.analyte),
+    )
+
+
+def buffer_state(analyte: Analyte, concentration: float, ph: float) -> BufferState:
+    """Species distribution and buffer capacity of an analyte at a pH.
+
+    Parameters
+    ----------
+    analyte : Analyte
+        The buffering acid.
+    concentration : float
+        Total concentration of the analyte in M.
+    ph : float
+        The pH of the solution.
+
+    Returns
+    -------
+    BufferState
+        The fractions of each protonation state, the mean charge and the buffer capacity
+        in M per pH unit.
+    """
+    alpha = fractions(np.array(ph), analyte.pkas)
+    removed = np.arange(len(analyte.pkas) + 1)
+
+    mean_removed = float(alpha @ removed)
+    variance = float(alpha @ removed**2) - mean_removed**2
+    capacity = math.log(10) * (10**-ph + 10 ** (ph - PKW) + concentration * variance)
+
+    return BufferState(
+        fractions=tuple(float(value) for value in alpha),
+        mean_charge=analyte.charge - mean_removed,
+        capacity=capacity,
+    )
+
+
+def render(parameters: TitrationParameters, curve: TitrationCurve) -> bytes:
+    """Plot a titration curve with its key points.
+
+    Parameters
+    ----------
+    parameters : TitrationParameters
+        The simulated titration.
+    curve : TitrationCurve
+        The simulated curve.
+
+    Returns
+    -------
+    bytes
+        The plot as PNG.
+    """
+    figure = new_figure()
+    axes = figure.add_subplot()
+
+    axes.plot(curve.volume, curve.ph, zorder=2)
+
+    for point in curve.half_equivalence_points:
+        axes.scatter(point.volume, point.ph, facecolors="none", edgecolors="tab:green", zorder=3)
+
+    for point in curve.equivalence_points:
+        axes.scatter(point.volume, point.ph, color="tab:red", zorder=3)
+        axes.annotate(
+            f"{point.label}\npH {point.ph:.2f}",
+            (point.volume, point.ph),
+            textcoords="offset points",
+            xytext=(6, -18),
+            fontsize="small",
+        )
+
+    if curve.isoelectric_point is not None:
+        axes.axhline(
+            curve.isoelectric_point,
+            color="tab:purple",
+            linestyle="--",
+            linewidth=1,
+            label=f"pI = {curve.isoelectric_point:.2f}",
+        )
+        axes.legend(loc="upper left")
+
+    axes.set_title(
+        f"{parameters.analyte.name} ({parameters.concentration:g} M, {parameters.volume:g} mL) "
+        f"with {parameters.titrant_concentration:g} M {parameters.titrant.value}"
+    )
+    axes.set_xlabel(f"{parameters.titrant.value} added (mL)")
+    axes.set_ylabel("pH")
+    axes.set_xlim(0, parameters.max_volume)
+    axes.set_ylim(min(0.0, float(curve.ph.min())), max(14.0, float(curve.ph.max())))
+    axes.grid(alpha=0.3)
+
+    return figure_to_png(figure)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def analyse(parameters: TitrationParameters) -> tuple[TitrationCurve, bytes]:
+    """Simulate and plot in one go, results are cached by parameters.
+
+    Parameters
+    ----------
+    parameters : TitrationParameters
+        The titration to simulate.
+
+    Returns
+    -------
+    tuple[TitrationCurve, bytes]
+        The curve and its plot as PNG.
+    """
+    curve = simulate(parameters)
+    return curve, render(parameters, curve)
@@ -4,7 +4,7 @@
 import discord
 from discord.ext import commands
 
-from biochemie_bot.utils.errors import ButtonOnCooldown
+from biochemie_bot.utils.errors import BotDraining, ButtonOnCooldown
 
 
 class BaseView(discord.ui.View):
@@ -31,6 +31,11 @@ def __init__(
             1, cooldown, _interaction_cooldown_key
         )
 
+        # Duck typed, importing the bot here would create an import cycle.
+        register_view = getattr(original_interaction.client, "register_view", None)
+        if register_view is not None:
+            register_view(self)
+
     @override
     async def on_timeout(self) -> None:
         for item in self.children:
@@ -43,6 +48,13 @@ async def on_timeout(self) -> None:
 
     @override
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if getattr(interaction.client, "draining", False):
+            raise BotDraining
+
+        track_current_task = getattr(interaction.client, "track_current_task", None)
+        if track_current_task is not None:
+            track_current_task()
+
         if await interaction.client.is_owner(interaction.user):  # type: ignore[reportAttributeAccessIssue]
             return True
 
@@ -74,6 +86,10 @@ async def on_error(
                 f"You are on cooldown. Try again in {time_left}s",
                 ephemeral=True,
             )
+        elif isinstance(error, BotDraining):
+            await interaction.response.send_message(
+                "The bot is shutting down, please try again later.", ephemeral=True
+            )
         else:
             return await super().on_error(interaction, error, item)
 
@@ -0,0 +1,78 @@
+from typing import Any
+
+import discord
+
+from biochemie_bot.utils.views.base import BaseView
+
+
+class PaginatorView(BaseView):
+    """View with buttons to go through a list of embeds."""
+
+    def __init__(
+        self,
+        author: discord.User | discord.Member,
+        interaction: discord.Interaction,
+        pages: list[discord.Embed],
+        cooldown: float = 0,
+        timeout: float | None = 180,
+    ) -> None:
+        super().__init__(
+            author=author,
+            original_interaction=interaction,
+            cooldown=cooldown,
+            timeout=timeout,
+        )
+        self.pages: list[discord.Embed] = pages
+        self.current_page: int = 0
+
+        for number, page in enumerate(self.pages, start=1):
+            page.set_footer(text=f"Page {number}/{len(self.pages)}")
+
+        self._update_buttons()
+
+    @property
+    def first_page(self) -> discord.Embed:
+        """The embed to send together with this view."""
+        return self.pages[0]
+
+    def _update_buttons(self) -> None:
+        at_start = self.current_page == 0
+        at_end = self.current_page == len(self.pages) - 1
+
+        self.go_to_first.disabled = at_start
+        self.go_to_previous.disabled = at_start
+        self.go_to_next.disabled = at_end
+        self.go_to_last.disabled = at_end
+
+    async def _show_page(self, interaction: discord.Interaction, page: int) -> None:
+        self.current_page = page
+        self._update_buttons()
+        await interaction.response.edit_message(embed=self.pages[page], view=self)
+
+    @discord.ui.button(label="≪", style=discord.ButtonStyle.grey)
+    async def go_to_first(
+        self, interaction: discord.Interaction, _button: discord.ui.Button[Any]
+    ) -> None:
+        """Go to the first page."""
+        await self._show_page(interaction, 0)
+
+    @discord.ui.button(label="Back", style=discord.ButtonStyle.blurple)
+    async def go_to_previous(
+        self, interaction: discord.Interaction, _button: discord.ui.Button[Any]
+    ) -> None:
+        """Go to the previous page."""
+        await self._show_page(interaction, self.current_page - 1)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.blurple)
+    async def go_to_next(
+        self, interaction: discord.Interaction, _button: discord.ui.Button[Any]
+    ) -> None:
+        """Go to the next page."""
+        await self._show_page(interaction, self.current_page + 1)
+
+    @discord.ui.button(label="≫", style=discord.ButtonStyle.grey)
+    async def go_to_last(
+        self, interaction: discord.Interaction, _button: discord.ui.Button[Any]
+    ) -> None:
+        """Go to the last page."""
+        await self._show_page(interaction, len(self.pages) - 1)
@@ -0,0 +1,37 @@
+import argparse
+import logging
+
+from biochemie_bot.utils.kmer_index import IndexKind, build_index
+
+
+def main() -> None:
+    """Build a k-mer index over a FASTA database, for use by the `/database` commands."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("fasta", help="the (multi-record) FASTA file to index")
+    parser.add_argument("output", help="directory to write the index to")
+    parser.add_argument("-k", type=int, default=None, help="k-mer length (default: 11 or 4)")
+    parser.add_argument(
+        "--protein", action="store_true", help="index protein instead of DNA sequences"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    log = logging.getLogger(__name__)
+
+    kind = IndexKind.PROTEIN if args.protein else IndexKind.DNA
+    k = args.k or (4 if args.protein else 11)
+
+    log.info("Building %s index with k=%d over %s", kind.value, k, args.fasta)
+    stats = build_index(args.fasta, args.output, k, kind)
+    log.info(
+        "Indexed %d records, %d residues and %d k-mers in %.1fs (%.1f M residues/s)",
+        stats.records,
+        stats.residues,
+        stats.kmers,
+        stats.seconds,
+        stats.residues / stats.seconds / 1e6,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -22,8 +22,14 @@ def main() -> None:  # noqa: D103
     intents.message_content = True
 
     initial_extensions: list[str] = [
+        "biochemie_bot.cogs.alignment",
+        "biochemie_bot.cogs.database",
         "biochemie_bot.cogs.developer",
+        "biochemie_bot.cogs.formula",
         "biochemie_bot.cogs.informatic",
+        "biochemie_bot.cogs.kinetics",
+        "biochemie_bot.cogs.sequence",
+        "biochemie_bot.cogs.titration",
     ]
 
     asyncio.run(run_bot(intents, initial_extensions))
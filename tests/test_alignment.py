@@ -0,0 +1,128 @@
+import itertools
+import random
+
+import pytest
+
+from biochemie_bot.utils import alignment as aln
+
+NEG = -(10**9)
+
+
+def brute_force(  # noqa: PLR0913, PLR0917
+    a: bytes,
+    b: bytes,
+    mode: aln.AlignmentMode,
+    matrix: aln.ScoringMatrix,
+    gap_open: int,
+    gap_extend: int,
+    band: int | None,
+) -> int:
+    """Score of the best alignment using plain Gotoh, only through cells within the band.
+
+    Returns
+    -------
+    int
+        The optimal score.
+    """
+    index, scores = aln.load_matrix(matrix)
+    n, m = len(a), len(b)
+    local = mode is aln.AlignmentMode.LOCAL
+
+    if band is None:
+        los, his = [1] * (n + 1), [m + 1] * (n + 1)
+    else:
+        los, his = aln._band_bounds(n, m, band)
+
+    def allowed(i: int, j: int) -> bool:
+        return i == 0 or (j == 0 and los[i] == 1) or los[i] <= j < his[i]
+
+    h = [[NEG] * (m + 1) for _ in range(n + 1)]
+    e = [[NEG] * (m + 1) for _ in range(n + 1)]
+    f = [[NEG] * (m + 1) for _ in range(n + 1)]
+    best = 0
+
+    for i, j in itertools.product(range(n + 1), range(m + 1)):
+        if not allowed(i, j):
+            continue
+
+        if i == 0 or j == 0:
+            length = i + j
+            h[i][j] = 0 if local or length == 0 else -(gap_open + (length - 1) * gap_extend)
+            continue
+
+        f[i][j] = max(h[i - 1][j] - gap_open, f[i - 1][j] - gap_extend)
+        e[i][j] = max(h[i][j - 1] - gap_open, e[i][j - 1] - gap_extend)
+        diagonal = h[i - 1][j - 1] + int(scores[index[a[i - 1]], index[b[j - 1]]])
+        h[i][j] = max(diagonal, e[i][j], f[i][j], 0 if local else NEG)
+        best = max(best, h[i][j])
+
+    return best if local else h[n][m]
+
+
+def rescore(
+    result: aln.Alignment, matrix: aln.ScoringMatrix, gap_open: int, gap_extend: int
+) -> int:
+    """Score of the aligned sequences of a result.
+
+    Returns
+    -------
+    int
+        The score of the alignment as shown.
+    """
+    index, scores = aln.load_matrix(matrix)
+    score = 0
+    previous = None
+
+    for x, y in zip(result.aligned_a, result.aligned_b, strict=True):
+        if x == "-" or y == "-":
+            gap = "a" if x == "-" else "b"
+            score -= gap_extend if gap == previous else gap_open
+            previous = gap
+        else:
+            score += int(scores[index[ord(x)], index[ord(y)]])
+            previous = None
+
+    return score
+
+
+@pytest.mark.parametrize("mode", list(aln.AlignmentMode))
+@pytest.mark.parametrize("band", [None, 0, 1, 2, 3])
+def test_align_matches_brute_force(mode: aln.AlignmentMode, band: int | None) -> None:
+    """Banded and unbanded alignments are optimal within their band, also without traceback."""
+    rng = random.Random(f"{mode.value}-{band}")
+
+    for _ in range(150):
+        n = rng.randint(1, 12)
+        a = bytes(rng.choices(b"ACGT", k=n))
+        b = bytes(rng.choices(b"ACGT", k=rng.randint(n, 16)))
+        gap_extend = rng.randint(0, 4)
+        gap_open = rng.randint(gap_extend, 12)
+        arguments = (mode, aln.ScoringMatrix.NUC, gap_open, gap_extend)
+
+        expected = brute_force(a, b, *arguments, band)
+        assert expected <= brute_force(a, b, *arguments, None)
+
+        assert aln.align(a, b, *arguments, band, traceback=False).score == expected
+
+        result = aln.align(a, b, *arguments, band)
+        assert result.score == expected
+        assert rescore(result, aln.ScoringMatrix.NUC, gap_open, gap_extend) == expected
+        assert result.aligned_a.replace("-", "") == a[result.start_a : result.end_a].decode()
+        assert result.aligned_b.replace("-", "") == b[result.start_b : result.end_b].decode()
+
+
+def test_banded_fragment_against_protein() -> None:
+    """A fragment aligned within a band never scores above the unbanded optimum."""
+    rng = random.Random(0)
+    residues = b"ACDEFGHIKLMNPQRSTVWY"
+
+    for _ in range(20):
+        protein = bytes(rng.choices(residues, k=300))
+        start = rng.randint(0, 200)
+        fragment = protein[start : start + rng.randint(20, 100)]
+
+        for mode in aln.AlignmentMode:
+            arguments = (mode, aln.ScoringMatrix.BLOSUM62, 10, 1)
+            result = aln.align(fragment, protein, *arguments, 20)
+            assert result.score <= aln.align(fragment, protein, *arguments).score
+            assert rescore(result, aln.ScoringMatrix.BLOSUM62, 10, 1) == result.score
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from biochemie_bot.utils import kinetics
+
+
+def mixed_data(rows: int) -> kinetics.KineticsData:
+    """Noisy rates of a mixed inhibitor, with Vmax 10, Km 2, Ki 1.5 and Ki' 4.
+
+    Returns
+    -------
+    kinetics.KineticsData
+        The generated measurements.
+    """
+    rng = np.random.default_rng(0)
+    substrate = rng.uniform(0.1, 50, rows)
+    inhibitor = rng.choice([0.0, 1.0, 2.0, 5.0], rows)
+    rate = 10 * substrate / (2 * (1 + inhibitor / 1.5) + substrate * (1 + inhibitor / 4))
+    rate *= 1 + rng.normal(0, 0.01, rows)
+    return kinetics.KineticsData(substrate, rate, inhibitor, "")
+
+
+def test_fit_best_recovers_parameters() -> None:
+    """The mixed model is picked and its parameters are recovered."""
+    result = kinetics.fit_best(mixed_data(200))
+
+    assert result.model is kinetics.KineticsModel.MIXED
+    np.testing.assert_allclose(
+        [parameter.value for parameter in result.parameters], [10, 2, 1.5, 4], rtol=0.05
+    )
+
+
+def test_start_grid_does_not_depend_on_chunk_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Evaluating the start grid in chunks selects the same starts as all at once."""
+    data = mixed_data(500)
+    chunked = kinetics._start_grid(data, kinetics.KineticsModel.MIXED)
+
+    monkeypatch.setattr(kinetics, "GRID_CHUNK_CELLS", 2**40)
+    np.testing.assert_allclose(chunked, kinetics._start_grid(data, kinetics.KineticsModel.MIXED))
+
+
+def test_blanks_are_left_out_of_the_fit() -> None:
+    """Rows without substrate do not fail the fit and do not count as measurements."""
+    data = kinetics.parse_csv(b"S,v\n0,0\n0,0.01\n1,0.5\n2,0.67\n4,0.8\n8,0.89\n16,0.94\n")
+    result = kinetics.fit(data, kinetics.KineticsModel.MICHAELIS_MENTEN)
+
+    assert result.observations == 5  # noqa: PLR2004